@@ -12,6 +12,10 @@ from typing import Any
 
 from snakecore.constants import UNSET
 
+_UTC = datetime.timezone.utc
+_fromtimestamp = datetime.datetime.fromtimestamp
+_time = time.time
+
 _EVENT_CLASS_MAP = {}
 
 
@@ -162,7 +166,7 @@ class BaseEvent:
         event_created_at: datetime.datetime | None = None,
         dispatcher: Any | None = None,
     ) -> None:
-        self._real_event_created_at_ts: float = time.time()
+        self._real_event_created_at_ts: float = _time()
         if event_created_at is None:
             self._event_created_at_ts = self._real_event_created_at_ts
         else:
@@ -207,10 +211,7 @@ class BaseEvent:
         datetime.datetime
             The time.
         """
-        return datetime.datetime.fromtimestamp(
-            self._real_event_created_at_ts,
-            tz=datetime.timezone.utc,
-        )
+        return _fromtimestamp(self._real_event_created_at_ts, _UTC)
 
     @property
     def event_created_at(self) -> datetime.datetime:
@@ -223,10 +224,7 @@ class BaseEvent:
         datetime.datetime
             The time.
         """
-        return datetime.datetime.fromtimestamp(
-            self._event_created_at_ts,
-            tz=datetime.timezone.utc,
-        )
+        return _fromtimestamp(self._event_created_at_ts, _UTC)
 
     @property
     def dispatcher(self) -> Any | None:
@@ -265,7 +263,7 @@ class BaseEvent:
         """
         unique_copy = self.copy()
         old_real_event_created_at_ts = unique_copy._real_event_created_at_ts
-        unique_copy._real_event_created_at_ts = time.time()
+        unique_copy._real_event_created_at_ts = _time()
         if old_real_event_created_at_ts is unique_copy._event_created_at_ts:
             # overwrite custom event creation time if none was initially provided
             unique_copy._event_created_at_ts = unique_copy._real_event_created_at_ts
@@ -8,7 +8,7 @@ into class namespaces.
 
 from typing import Literal, Type, Union
 
-from snakecore.jobs.minijobs import MiniJobBase
+from .minijobs import MiniJobBase
 
 from . import proxies
 from .jobs import JobBase
@@ -7,6 +7,7 @@ asynchronous task execution system.
 """
 import asyncio
 import datetime
+import functools
 import inspect
 import sys
 import time
@@ -16,6 +17,7 @@ from typing import (
     Any,
     Callable,
     Coroutine,
+    Iterable,
     Literal,
     Mapping,
     ParamSpec,
@@ -39,7 +41,6 @@ from snakecore.exceptions import (
     JobOutputError,
     JobStateError,
 )
-from snakecore import utils
 from snakecore.constants import (
     UNSET,
 )
@@ -54,6 +55,30 @@ else:
 _P = ParamSpec("_P")
 _T = TypeVar("_T")
 
+_UTC = datetime.timezone.utc
+_fromtimestamp = datetime.datetime.fromtimestamp
+_time = time.time
+_time_ns = time.time_ns
+
+if sys.version_info >= (3, 11):
+
+    async def _wait_for(fut: asyncio.Future[_T], timeout: float | None) -> _T:
+        # unlike `asyncio.wait_for()`, this doesn't wrap `fut` in a new task
+        if timeout is None:
+            return await fut
+
+        async with asyncio.timeout(timeout):
+            return await fut
+
+else:
+
+    async def _wait_for(fut: asyncio.Future[_T], timeout: float | None) -> _T:
+        if timeout is None:
+            return await fut
+
+        return await asyncio.wait_for(fut, timeout)
+
+
 _JOB_CLASS_MAP = {}
 # A dictionary of all Job subclasses that were created.
 # Do not access outside of this module.
@@ -62,19 +87,254 @@ _JOB_CLASS_UUID_MAP = {}
 # A dictionary of all Job subclasses by their UUID.
 # Do not access outside of this module.
 
+_DONE_MASK = JF.KILLED | JF.COMPLETED
+_STOPPING_BY_FORCE_MASK = JF.IS_STOPPING | JF.TOLD_TO_STOP_BY_FORCE
+_RESTARTING_MASK = JF.IS_STOPPING | JF.TOLD_TO_RESTART
+_BEING_KILLED_MASK = JF.IS_STOPPING | JF.TOLD_TO_BE_KILLED
+_BEING_STARTUP_KILLED_MASK = (
+    JF.EXTERNAL_STARTUP_KILL | JF.IS_STOPPING | JF.TOLD_TO_BE_KILLED
+)
+_COMPLETING_MASK = JF.IS_STOPPING | JF.TOLD_TO_COMPLETE
+_SKIP_RUN_MASK = JF.EXTERNAL_STARTUP_KILL | JF.INTERNAL_STARTUP_KILL | JF.SKIP_NEXT_RUN
+_STOPPED_OR_DONE_MASK = JF.STOPPED | JF.KILLED | JF.COMPLETED
+_TOLD_TO_FINISH_MASK = JF.TOLD_TO_COMPLETE | JF.TOLD_TO_BE_KILLED
+_STOP_PENDING_MASK = JF.TOLD_TO_STOP | JF.IS_STOPPING
+_STOP_PENDING_OR_STOPPED_MASK = _STOP_PENDING_MASK | JF.STOPPED
+_SELF_STOP_MASK = _STOP_PENDING_MASK | JF.TOLD_TO_STOP_BY_SELF
+_RESTART_OR_FORCE_STOP_MASK = JF.TOLD_TO_RESTART | JF.TOLD_TO_STOP_BY_FORCE
+# Precomputed flag masks for the state query methods of job objects.
+
+_INIT_CLEAR_MASK = (
+    _DONE_MASK
+    | _TOLD_TO_FINISH_MASK
+    | JF.INTERNAL_STARTUP_KILL
+    | JF.EXTERNAL_STARTUP_KILL
+)
+_START_CLEAR_MASK = JF.STOPPED | JF.IS_IDLING
+_STOP_CLEANUP_MASK = (
+    JF.SKIP_NEXT_RUN
+    | JF.IS_STARTING
+    | JF.INTERNAL_STARTUP_KILL
+    | JF.EXTERNAL_STARTUP_KILL
+    | JF.TOLD_TO_STOP
+    | JF.TOLD_TO_STOP_BY_SELF
+    | JF.TOLD_TO_STOP_BY_FORCE
+    | JF.IS_STOPPING
+    | JF.TOLD_TO_RESTART
+)
+_CORE_STOP_CLEANUP_MASK = (
+    JF.SKIP_NEXT_RUN
+    | JF.IS_STARTING
+    | JF.TOLD_TO_STOP
+    | JF.TOLD_TO_STOP_BY_SELF
+    | JF.TOLD_TO_STOP_BY_FORCE
+    | JF.IS_STOPPING
+    | JF.TOLD_TO_RESTART
+    | JF.IS_IDLING
+    | JF.STOPPED
+)
+# Precomputed flag masks cleared when job objects are created, start or stop running.
+
+_RUNNING_STATUS_MASK = (
+    JF.IS_STARTING
+    | JF.IS_IDLING
+    | JF.IS_STOPPING
+    | JF.TOLD_TO_COMPLETE
+    | JF.TOLD_TO_BE_KILLED
+    | JF.TOLD_TO_RESTART
+)
+
+
+def _build_running_status_table() -> dict[int, JobStatus]:
+    # map every combination of the flags in `_RUNNING_STATUS_MASK` to the status
+    # that a running job with those flags has
+    table = {}
+    bools = _RUNNING_STATUS_MASK
+    while True:
+        if bools & JF.IS_STARTING:
+            status = JobStatus.STARTING
+        elif bools & JF.IS_IDLING:
+            status = JobStatus.IDLING
+        elif bools & JF.IS_STOPPING:
+            if bools & JF.TOLD_TO_COMPLETE:
+                status = JobStatus.COMPLETING
+            elif bools & JF.TOLD_TO_BE_KILLED:
+                status = JobStatus.BEING_KILLED
+            elif bools & JF.TOLD_TO_RESTART:
+                status = JobStatus.RESTARTING
+            else:
+                status = JobStatus.STOPPING
+        else:
+            status = JobStatus.RUNNING
+
+        table[bools] = status
+        if not bools:
+            break
+
+        bools = (bools - 1) & _RUNNING_STATUS_MASK  # next subset of the mask
+
+    return table
+
+
+_RUNNING_STATUS_TABLE = _build_running_status_table()
+# Lookup table used by `JobCore.status()` for running jobs.
+
+_CORE_STOPPING_REASON_MASK = JF.TOLD_TO_STOP_BY_SELF | JF.TOLD_TO_RESTART
+_STOPPING_REASON_MASK = (
+    _CORE_STOPPING_REASON_MASK | JF.TOLD_TO_COMPLETE | JF.TOLD_TO_BE_KILLED
+)
+
+
+def _build_stopping_reason_table(
+    mask: int,
+) -> dict[int, JobStopReasons.Internal | JobStopReasons.External]:
+    # map every combination of the flags in `mask` to the reason that a job
+    # stopping with those flags (and without errors) has
+    table = {}
+    bools = mask
+    while True:
+        if bools & JF.TOLD_TO_STOP_BY_SELF:
+            if bools & JF.TOLD_TO_RESTART:
+                reason = JobStopReasons.Internal.RESTART
+            elif bools & JF.TOLD_TO_COMPLETE:
+                reason = JobStopReasons.Internal.COMPLETION
+            elif bools & JF.TOLD_TO_BE_KILLED:
+                reason = JobStopReasons.Internal.KILLING
+            else:
+                reason = JobStopReasons.Internal.UNSPECIFIC
+        else:
+            if bools & JF.TOLD_TO_RESTART:
+                reason = JobStopReasons.External.RESTART
+            elif bools & JF.TOLD_TO_BE_KILLED:
+                reason = JobStopReasons.External.KILLING
+            else:
+                reason = JobStopReasons.External.UNKNOWN
+
+        table[bools] = reason
+        if not bools:
+            break
+
+        bools = (bools - 1) & mask  # next subset of the mask
+
+    return table
+
+
+_CORE_STOPPING_REASON_TABLE = _build_stopping_reason_table(_CORE_STOPPING_REASON_MASK)
+_STOPPING_REASON_TABLE = _build_stopping_reason_table(_STOPPING_REASON_MASK)
+
+_EMPTY_MAPPING_PROXY = MappingProxyType({})
+# shared by jobs that don't guard any other jobs
+
+_STOP_REASON_TYPES = frozenset((JobStopReasons.External, JobStopReasons.Internal))
+# enums with members can't be subclassed, so exact type checks suffice
+
+
+def _promote_name_record(
+    cls: type,
+    attr_name: str,
+    record_cls: "type[groupings.NameRecord]",
+    extra_bases: tuple[type, ...] = (),
+) -> None:
+    # turn a placeholder class namespace like 'OutputFields' defined on a job class
+    # into a subclass of the given name record class, if it isn't one already
+    record = getattr(cls, attr_name)
+    if issubclass(record, record_cls):
+        return
+
+    if record.__base__ is not object:
+        raise TypeError(
+            f"the '{attr_name}' variable must be a subclass of "
+            f"'{record_cls.__name__}' or an immediate subclass of object that "
+            "acts as a placeholder"
+        )
+
+    setattr(
+        cls,
+        attr_name,
+        type(attr_name, (record_cls, *extra_bases), dict(**record.__dict__)),
+    )
+
+
+def _get_enabled_output_names(
+    output_names: "type[groupings.OutputNameRecord] | None",
+) -> tuple[str, ...]:
+    # collect the names of an 'OutputFields' or 'OutputQueues' class namespace
+    # that are not marked as disabled
+    if output_names is None:
+        return ()
+
+    return tuple(
+        name
+        for name in dir(output_names)
+        if not name.startswith("_")
+        and isinstance(value := getattr(output_names, name, None), str)
+        and value != "DISABLED"
+    )
+
+
+def _add_waiter(futs: list[asyncio.Future], fut: asyncio.Future) -> None:
+    # waiters that timed out stay in their list as cancelled futures until it
+    # is resolved, so sweep them out whenever the list length reaches a power
+    # of two, to keep long-lived lists from growing without bounds
+    n = len(futs)
+    if n >= 16 and not n & (n - 1):
+        futs[:] = [f for f in futs if not f.done()]
+    futs.append(fut)
+
+
+def _set_futures_result(futs: Iterable[asyncio.Future], result: Any) -> None:
+    # resolve waiter futures, skipping those that were cancelled after
+    # timing out
+    for fut in futs:
+        if not fut.done():
+            fut.set_result(result)
+
+
+@functools.lru_cache(maxsize=256)
+def _datetime_from_ts(ts: float) -> datetime.datetime:
+    # job state timestamps only change on state transitions, so the same few
+    # values are converted over and over by the `*_since()` getters
+    return _fromtimestamp(ts, _UTC)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_runtime_id(class_runtime_id: str) -> tuple[str, ...]:
+    # runtime ids are immutable strings, so splitting them can be memoized
+    return tuple(class_runtime_id.split("-"))
+
+
+@functools.lru_cache(maxsize=256)
+def _lookup_runtime_id_cached(
+    class_runtime_id: str, closest_match: bool
+) -> type["JobBase"]:
+    # cleared by `_JobCore.__init_subclass__()` whenever a job class is registered
+    name, timestamp_str = _parse_runtime_id(class_runtime_id)
+
+    classes = _JOB_CLASS_MAP.get(name)
+    if classes is not None:
+        cls = classes.get(timestamp_str)
+        if cls is not None:
+            return cls
+        elif closest_match and classes:
+            return next(iter(classes.values()))
+
+    raise KeyError(class_runtime_id)
+
+
+@functools.lru_cache(maxsize=256)
+def _lookup_uuid_cached(class_uuid: str) -> type["JobBase"]:
+    # cleared by `_JobCore.__init_subclass__()` whenever a job class is registered
+    return _JOB_CLASS_UUID_MAP[class_uuid]
+
 
 def get_job_class_from_runtime_id(
     class_runtime_id: str, default: Any = UNSET, /, closest_match: bool = False
 ) -> "JobBase":
 
-    name, timestamp_str = class_runtime_id.split("-")
-
-    if name in _JOB_CLASS_MAP:
-        if timestamp_str in _JOB_CLASS_MAP[name]:
-            return _JOB_CLASS_MAP[name][timestamp_str]
-        elif closest_match:
-            for ts_str in _JOB_CLASS_MAP[name]:
-                return _JOB_CLASS_MAP[name][ts_str]
+    try:
+        return _lookup_runtime_id_cached(class_runtime_id, closest_match)
+    except KeyError:
+        pass
 
     if default is UNSET:
         raise LookupError(
@@ -90,8 +350,10 @@ def get_job_class_from_uuid(
     /,
 ) -> "JobBase | Any":
 
-    if class_uuid in _JOB_CLASS_UUID_MAP:
-        return _JOB_CLASS_UUID_MAP[class_uuid]
+    try:
+        return _lookup_uuid_cached(class_uuid)
+    except KeyError:
+        pass
 
     if default is UNSET:
         raise KeyError(
@@ -206,6 +468,8 @@ def get_job_class_runtime_id(
 
     try:
         class_runtime_id = cls._RUNTIME_ID
+        name = cls._RUNTIME_NAME
+        timestamp_str = cls._RUNTIME_TS
     except AttributeError:
         if default is UNSET:
             raise TypeError(
@@ -213,15 +477,6 @@ def get_job_class_runtime_id(
             ) from None
         return default
 
-    try:
-        name, timestamp_str = class_runtime_id.split("-")
-    except (ValueError, AttributeError):
-        if default is UNSET:
-            raise ValueError(
-                "invalid identifier found in the given job class"
-            ) from None
-        return default
-
     if name in _JOB_CLASS_MAP:
         if timestamp_str in _JOB_CLASS_MAP[name]:
             if _JOB_CLASS_MAP[name][timestamp_str] is cls:
@@ -258,14 +513,20 @@ class JobNamespace(SimpleNamespace):
         return iter(self.__dict__.items())
 
     def copy(self):
-        return self.__class__(**self.__dict__)
+        # update the new instance's `__dict__` in one call instead of
+        # rebinding every attribute through keyword arguments
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        return new
 
     def to_dict(self) -> dict:
-        return dict(self.__dict__)
+        return self.__dict__.copy()
 
     @staticmethod
     def from_dict(dct):
-        return JobNamespace(**dct)
+        new = JobNamespace.__new__(JobNamespace)
+        new.__dict__.update(dct)
+        return new
 
     __copy__ = copy
 
@@ -336,12 +597,14 @@ def publicjobmethod(
 
     def inner_deco(func: Callable[_P, _T]) -> Callable[_P, _T]:
         if isinstance(func, FunctionType):
-            func.__public = True  # type: ignore
-            func.__disabled = bool(disabled)  # type: ignore
-            func.__is_async = (  # type: ignore
-                is_async
-                if isinstance(is_async, bool)
-                else inspect.iscoroutinefunction(func)
+            # (disabled, is_async)
+            func.__job_public_method__ = (  # type: ignore
+                bool(disabled),
+                (
+                    is_async
+                    if isinstance(is_async, bool)
+                    else inspect.iscoroutinefunction(func)
+                ),
             )
             return func  # type: ignore
 
@@ -362,6 +625,7 @@ class _JobCore:
         "_count",
         "_loop_count",
         "_created_at_ts",
+        "_created_at",
         "_runtime_id",
         "_data",
         "_job_loop",
@@ -378,7 +642,10 @@ class _JobCore:
 
     _CREATED_AT = datetime.datetime.now(datetime.timezone.utc)
     _UUID: str | None = None
-    _RUNTIME_ID = f"JobBase-{int(_CREATED_AT.timestamp()*1_000_000_000)}"
+    _RUNTIME_NAME = "JobBase"
+    _RUNTIME_TS = f"{int(_CREATED_AT.timestamp()*1_000_000_000)}"
+    _RUNTIME_ID = f"{_RUNTIME_NAME}-{_RUNTIME_TS}"
+    # the runtime id and its precomputed name and timestamp parts
 
     Namespace = JobNamespace
 
@@ -386,17 +653,17 @@ class _JobCore:
         if getattr(cls, f"{cls.__qualname__}_INIT", False):
             raise RuntimeError("This job class was already initialized")
 
-        cls._CREATED_AT = datetime.datetime.now(datetime.timezone.utc)
+        created_at_ns = _time_ns()
+        cls._CREATED_AT = _fromtimestamp(created_at_ns / 1_000_000_000, _UTC)
 
         name = cls.__qualname__
-        created_timestamp_ns_str = f"{int(cls._CREATED_AT.timestamp()*1_000_000_000)}"
+        created_timestamp_ns_str = str(created_at_ns)
 
+        cls._RUNTIME_NAME = name
+        cls._RUNTIME_TS = created_timestamp_ns_str
         cls._RUNTIME_ID = f"{name}-{created_timestamp_ns_str}"
 
-        if name not in _JOB_CLASS_MAP:
-            _JOB_CLASS_MAP[name] = {}
-
-        _JOB_CLASS_MAP[name][created_timestamp_ns_str] = cls
+        _JOB_CLASS_MAP.setdefault(name, {})[created_timestamp_ns_str] = cls
 
         if class_uuid is not None:
             if not isinstance(class_uuid, str):
@@ -414,15 +681,19 @@ class _JobCore:
 
             _JOB_CLASS_UUID_MAP[class_uuid] = cls
 
+        _lookup_runtime_id_cached.cache_clear()
+        _lookup_uuid_cached.cache_clear()
+
         setattr(cls, f"{cls.__qualname__}_INIT", True)
 
     def __init__(self) -> None:
-        self._created_at_ts = time.time()
+        created_at_ns = _time_ns()
+        self._created_at_ts = created_at_ns / 1_000_000_000
+        self._created_at: datetime.datetime | None = None
+        # built from `_created_at_ts` on first access of `created_at`
         self._data = self.Namespace()
 
-        self._runtime_id: str = (
-            f"{self.__class__._RUNTIME_ID}:{int(self._created_at_ts*1_000_000_000)}"
-        )
+        self._runtime_id: str = f"{self.__class__._RUNTIME_ID}:{created_at_ns}"
 
         self._interval_secs: float = 0
         self._time = None
@@ -436,7 +707,7 @@ class _JobCore:
         self._on_run_exception: BaseException | None = None
         self._on_stop_exception: BaseException | None = None
 
-        self._bools = 0
+        self._bools: int = 0  # bit flags from `JobBoolFlags`, kept as a plain int
 
         self._stop_futures: list[asyncio.Future[bool | JobStatus]] | None = None
 
@@ -476,9 +747,9 @@ class _JobCore:
 
     @property
     def created_at(self) -> datetime.datetime:
-        return datetime.datetime.fromtimestamp(
-            self._created_at_ts, tz=datetime.timezone.utc
-        )
+        if (created_at := self._created_at) is None:
+            created_at = self._created_at = _fromtimestamp(self._created_at_ts, _UTC)
+        return created_at
 
     @property
     def data(self) -> Namespace:
@@ -495,7 +766,7 @@ class _JobCore:
         else:
             self._bools &= ~JF.IS_INITIALIZING  # False
             self._bools |= JF.INITIALIZED  # True
-            self._initialized_since_ts = time.time()
+            self._initialized_since_ts = _time()
 
     async def on_init(self) -> None:
         """DO NOT CALL THIS METHOD MANUALLY, EXCEPT WHEN USING `super()`
@@ -511,20 +782,18 @@ class _JobCore:
         self._on_stop_exception = None
 
         self._bools |= JF.IS_STARTING  # True
-        self._bools &= ~(JF.STOPPED | JF.IS_IDLING)  # False
+        self._bools &= ~_START_CLEAR_MASK  # False
 
         self._stopped_since_ts = None
         self._idling_since_ts = None
 
-        self._running_since_ts = time.time()
+        self._running_since_ts = _time()
 
         try:
             await self.on_start()
         except Exception as exc:
             self._on_start_exception = exc
-            self._bools |= (
-                JF.TOLD_TO_STOP | JF.TOLD_TO_STOP_BY_SELF | JF.IS_STOPPING
-            )  # True
+            self._bools |= _SELF_STOP_MASK  # True
             await self.on_start_error(exc)
             self._stop_cleanup(reason=JobStopReasons.Internal.ERROR)
             raise
@@ -573,33 +842,20 @@ class _JobCore:
         reason: JobStopReasons.Internal | JobStopReasons.External | None = None,
     ) -> None:
         self._last_stopping_reason = (
-            reason
-            if isinstance(reason, (JobStopReasons.External, JobStopReasons.Internal))
-            else self.get_stopping_reason()
+            reason if type(reason) in _STOP_REASON_TYPES else self.get_stopping_reason()
         )
 
         self._loop_count = 0
 
-        self._bools &= ~(
-            JF.SKIP_NEXT_RUN
-            | JF.IS_STARTING
-            | JF.TOLD_TO_STOP
-            | JF.TOLD_TO_STOP_BY_SELF
-            | JF.TOLD_TO_STOP_BY_FORCE
-            | JF.IS_STOPPING
-            | JF.TOLD_TO_RESTART
-            | JF.IS_IDLING
-            | JF.STOPPED
-        )  # False
+        self._bools &= ~_CORE_STOP_CLEANUP_MASK  # False
 
         self._idling_since_ts = None
         self._running_since_ts = None
-        self._stopped_since_ts = time.time()
+        self._stopped_since_ts = _time()
 
-        if self._stop_futures is not None:
-            for fut in self._stop_futures:
-                if not fut.done():
-                    fut.set_result(JobStatus.STOPPED)
+        if futs := self._stop_futures:
+            self._stop_futures = None
+            _set_futures_result(futs, JobStatus.STOPPED)
 
     async def _on_stop(self) -> None:
         self._bools |= JF.IS_STOPPING  # True
@@ -650,9 +906,7 @@ class _JobCore:
 
     async def _on_run_error(self, exc: Exception) -> None:
         self._on_run_exception = exc
-        self._bools |= (
-            JF.TOLD_TO_STOP | JF.TOLD_TO_STOP_BY_SELF | JF.IS_STOPPING
-        )  # True
+        self._bools |= _SELF_STOP_MASK  # True
         await self.on_run_error(exc)
 
     async def on_run_error(self, exc: Exception) -> None:
@@ -722,9 +976,7 @@ class _JobCore:
         to a job stopping do not count as being forcefully stopped.
         This can only return `True` if `is_stoping()` returns `True`.
         """
-        return (
-            self._bools & (TRUE := JF.IS_STOPPING | JF.TOLD_TO_STOP_BY_FORCE) == TRUE
-        )  # all
+        return self._bools & _STOPPING_BY_FORCE_MASK == _STOPPING_BY_FORCE_MASK  # all
 
     def get_stopping_reason(
         self,
@@ -738,7 +990,8 @@ class _JobCore:
             `JobStopReasons` namespace, if applicable.
         """
 
-        if not self._bools & JF.IS_STOPPING:
+        bools = self._bools
+        if not bools & JF.IS_STOPPING:
             return
         elif (
             self._on_start_exception
@@ -748,16 +1001,8 @@ class _JobCore:
             return JobStopReasons.Internal.ERROR
         elif self._job_loop.current_loop == self._count:
             return JobStopReasons.Internal.EXECUTION_COUNT_LIMIT
-        elif self._bools & JF.TOLD_TO_STOP_BY_SELF:
-            if self._bools & JF.TOLD_TO_RESTART:
-                return JobStopReasons.Internal.RESTART
-            else:
-                return JobStopReasons.Internal.UNSPECIFIC
-        else:
-            if self._bools & JF.TOLD_TO_RESTART:
-                return JobStopReasons.External.RESTART
-            else:
-                return JobStopReasons.External.UNKNOWN
+
+        return _CORE_STOPPING_REASON_TABLE[bools & _CORE_STOPPING_REASON_MASK]
 
     def add_to_exception_whitelist(self, *exception_types: type[BaseException]) -> None:
         """Add exceptions to a whitelist, which allows them to be ignored
@@ -883,7 +1128,7 @@ class _JobCore:
         task = self._job_loop.get_task()
 
         if (
-            not self._bools & (JF.TOLD_TO_STOP | JF.IS_STOPPING | JF.STOPPED)  # not any
+            not self._bools & _STOP_PENDING_OR_STOPPED_MASK  # not any
             and task is not None
             and not task.done()
         ):
@@ -913,11 +1158,7 @@ class _JobCore:
             Whether the call was successful.
         """
 
-        if self.stop(force=force):
-            self._bools |= JF.TOLD_TO_STOP_BY_SELF  # True
-            return True
-
-        return False
+        return self.stop(force=force)  # also sets `TOLD_TO_STOP_BY_SELF`
 
     def restart(self) -> bool:
         """DO NOT CALL THIS METHOD FROM OUTSIDE YOUR JOB SUBCLASS.
@@ -936,20 +1177,15 @@ class _JobCore:
 
         task = self._job_loop.get_task()
         if (
-            not self._bools & (JF.TOLD_TO_RESTART | JF.TOLD_TO_STOP_BY_FORCE)  # not any
+            not self._bools & _RESTART_OR_FORCE_STOP_MASK  # not any
             and task is not None
             and not task.done()
         ):
-
-            def restart_when_over(fut):
-                task.remove_done_callback(restart_when_over)
-                self._start()
-
-            if not self._bools & (JF.TOLD_TO_STOP | JF.IS_STOPPING):  # not any
+            if not self._bools & _STOP_PENDING_MASK:  # not any
                 # forceful restart
                 self.stop(force=True)
 
-            task.add_done_callback(restart_when_over)
+            task.add_done_callback(self._restart_when_over)
             self._bools |= JF.TOLD_TO_RESTART  # True
             return True
 
@@ -962,25 +1198,29 @@ class _JobCore:
         task = self._job_loop.get_task()
 
         if (
-            not self._bools & (JF.TOLD_TO_RESTART | JF.TOLD_TO_STOP_BY_FORCE)  # not any
+            not self._bools & _RESTART_OR_FORCE_STOP_MASK  # not any
             and task is not None
             and not task.done()
         ):
-
-            def restart_when_over(fut):
-                task.remove_done_callback(restart_when_over)
-                self._start_external()
-
-            if not self._bools & (JF.TOLD_TO_STOP | JF.IS_STOPPING):  # not any
+            if not self._bools & _STOP_PENDING_MASK:  # not any
                 # forceful restart
                 self._stop_external(force=True)
 
-            task.add_done_callback(restart_when_over)
+            task.add_done_callback(self._restart_external_when_over)
             self._bools |= JF.TOLD_TO_RESTART  # True
             return True
 
         return False
 
+    def _restart_when_over(self, task: asyncio.Task) -> None:
+        # done callback for the job loop task, used by `restart()` instead of
+        # a fresh closure per call
+        self._start()
+
+    def _restart_external_when_over(self, task: asyncio.Task) -> None:
+        # done callback for the job loop task, used by `_restart_external()`
+        self._start_external()
+
     def loop_count(self) -> int:
         """`int`: The current amount of `on_run()` calls completed by this job object."""
         return self._loop_count
@@ -997,9 +1237,7 @@ class _JobCore:
     def initialized_since(self) -> datetime.datetime | None:
         """`datetime.datetime | None`: The time at which this job object was initialized, if available."""
         if self._initialized_since_ts:
-            return datetime.datetime.fromtimestamp(
-                self._initialized_since_ts, tz=datetime.timezone.utc
-            )
+            return _datetime_from_ts(self._initialized_since_ts)
         return None
 
     def is_starting(self) -> bool:
@@ -1008,18 +1246,17 @@ class _JobCore:
 
     def is_running(self) -> bool:
         """`bool`: Whether this job is currently running (alive and not stopped)."""
-        return (
-            self.initialized()
+        bools = self._bools
+        return bool(
+            bools & JF.INITIALIZED
+            and not bools & JF.STOPPED
             and self._job_loop.is_running()
-            and not self._bools & JF.STOPPED
         )
 
     def running_since(self) -> datetime.datetime | None:
         """`datetime.datetime | None`: The last time at which this job object started running, if available."""
         if self._running_since_ts:
-            return datetime.datetime.fromtimestamp(
-                self._running_since_ts, tz=datetime.timezone.utc
-            )
+            return _datetime_from_ts(self._running_since_ts)
         return None
 
     def stopped(self) -> bool:
@@ -1029,9 +1266,7 @@ class _JobCore:
     def stopped_since(self) -> datetime.datetime | None:
         """`datetime.datetime | None`: The last time at which this job object stopped, if available."""
         if self._stopped_since_ts:
-            return datetime.datetime.fromtimestamp(
-                self._stopped_since_ts, tz=datetime.timezone.utc
-            )
+            return _datetime_from_ts(self._stopped_since_ts)
         return None
 
     def is_idling(self) -> bool:
@@ -1043,9 +1278,7 @@ class _JobCore:
     def idling_since(self) -> datetime.datetime | None:
         """`datetime.datetime | None`: The last time at which this job object began idling, if available."""
         if self._idling_since_ts:
-            return datetime.datetime.fromtimestamp(
-                self._idling_since_ts, tz=datetime.timezone.utc
-            )
+            return _datetime_from_ts(self._idling_since_ts)
         return None
 
     def run_failed(self) -> bool:
@@ -1057,9 +1290,7 @@ class _JobCore:
     def is_restarting(self) -> bool:
         """`bool`: Whether this job is restarting."""
 
-        return (
-            self._bools & (TRUE := JF.IS_STOPPING | JF.TOLD_TO_RESTART) == TRUE
-        )  # any
+        return self._bools & _RESTARTING_MASK == _RESTARTING_MASK  # all
 
     def was_restarted(self) -> bool:
         """`bool`: A convenience method to check if a job was restarted."""
@@ -1103,35 +1334,35 @@ class _JobCore:
         if self._stop_futures is None:
             self._stop_futures = []
 
-        self._stop_futures.append(fut)
+        _add_waiter(self._stop_futures, fut)
 
-        return asyncio.wait_for(fut, timeout)
+        return _wait_for(fut, timeout)
 
     def status(self) -> JobStatus:
         """`JobStatus`: Get the job status of this job as a value from the
         `JobStatus` enum.
         """
-        output = None
-        if self.is_running():
-            if self.is_starting():
-                output = JobStatus.STARTING
-            elif self.is_idling():
-                output = JobStatus.IDLING
-            elif self.is_stopping():
-                if self.is_restarting():
-                    output = JobStatus.RESTARTING
-                else:
-                    output = JobStatus.STOPPING
-            else:
-                output = JobStatus.RUNNING
-        elif self.stopped():
-            output = JobStatus.STOPPED
-        elif self.initialized():
-            output = JobStatus.INITIALIZED
-        else:
-            output = JobStatus.FRESH
-
-        return output
+        bools = self._bools
+        if (
+            bools & JF.INITIALIZED
+            and not bools & JF.STOPPED
+            and self._job_loop.is_running()
+        ):  # same as `is_running()`
+            if bools & JF.IS_STARTING:
+                return JobStatus.STARTING
+            elif bools & JF.IS_IDLING:
+                return JobStatus.IDLING
+            elif bools & JF.IS_STOPPING:
+                if bools & JF.TOLD_TO_RESTART:
+                    return JobStatus.RESTARTING
+                return JobStatus.STOPPING
+            return JobStatus.RUNNING
+        elif bools & JF.STOPPED:
+            return JobStatus.STOPPED
+        elif bools & JF.INITIALIZED:
+            return JobStatus.INITIALIZED
+
+        return JobStatus.FRESH
 
     def __repr__(self):
         output_str = f"<{self.__class__.__qualname__} " f"(id={self._runtime_id})>"
@@ -1141,8 +1372,8 @@ class _JobCore:
     def __str__(self):
         return (
             f"<{self.__class__.__qualname__} "
-            + f"(id={self._runtime_id} created_at={self.created_at} "
-            + f"status={self.status().name})>"
+            f"(id={self._runtime_id} created_at={self.created_at} "
+            f"status={self.status().name})>"
         )
 
 
@@ -1153,6 +1384,7 @@ class JobCore(_JobCore):
 
     __slots__ = (
         "_manager",
+        "_create_future",
         "_creator",
         "_permission_level",
         "_registered_at_ts",
@@ -1162,11 +1394,13 @@ class JobCore(_JobCore):
         "_output_queue_proxies",
         "_output_field_futures",
         "_output_queue_futures",
+        "_output_queue_cancel_futures",
         "_unguard_futures",
         "_done_futures",
         "_done_callbacks",
         "_proxy",
         "_guarded_job_proxies_dict",
+        "_guarded_jobs_view",
         "_guardian",
         "_alive_since_ts",
     )
@@ -1182,6 +1416,13 @@ class JobCore(_JobCore):
     PUBLIC_METHODS_MAP: dict[str, Callable[..., Any]] | None = None
     PUBLIC_METHODS_CHAINMAP: FastChainMap | None = None
 
+    _OUTPUT_FIELD_NAMES: tuple[str, ...] = ()
+    _FROZEN_OUTPUT_FIELD_NAMES: frozenset[str] = frozenset()
+    _OUTPUT_QUEUE_NAMES: tuple[str, ...] = ()
+    _FROZEN_OUTPUT_QUEUE_NAMES: frozenset[str] = frozenset()
+    _PUBLIC_METHOD_NAMES: tuple[str, ...] = ()
+    _PUBLIC_METHODS_DICT: dict[str, tuple[Callable[..., Any], bool, bool]] = {}
+
     def __init_subclass__(
         cls,
         class_uuid: str | None = None,
@@ -1191,75 +1432,65 @@ class JobCore(_JobCore):
         name = cls.__qualname__
 
         if isinstance(cls.OutputFields, type):
-            if not issubclass(cls.OutputFields, groupings.OutputNameRecord):
-                if cls.OutputFields.__base__ is not object:
-                    raise TypeError(
-                        "the 'OutputFields' variable must be a subclass of 'OutputNameRecord' "
-                        "or an immediate subclass of object that acts as a placeholder"
-                    )
-
-                cls.OutputFields = type(
-                    "OutputFields",
-                    (groupings.OutputNameRecord,),
-                    dict(**cls.OutputFields.__dict__),
-                )
+            _promote_name_record(cls, "OutputFields", groupings.OutputNameRecord)
 
         if isinstance(cls.OutputQueues, type):
-            if not issubclass(cls.OutputQueues, groupings.OutputNameRecord):
-                if cls.OutputQueues.__base__ is not object:
-                    raise TypeError(
-                        "the 'OutputQueues' variable must be a subclass of 'OutputNameRecord' "
-                        "or an immediate subclass of object that acts as a placeholder"
-                    )
+            _promote_name_record(cls, "OutputQueues", groupings.OutputNameRecord)
 
-                cls.OutputQueues = type(
-                    "OutputQueues",
-                    (groupings.OutputNameRecord,),
-                    dict(**cls.OutputQueues.__dict__),
-                )
+        public_methods_map = {}
+        for name, obj in cls.__dict__.items():
+            if (
+                isinstance(obj, FunctionType)
+                and "__job_public_method__" in obj.__dict__
+            ):
+                public_methods_map[name] = obj
 
-        if isinstance(cls.PublicMethods, type):
-            if not issubclass(cls.PublicMethods, groupings.NameRecord):
-                if cls.PublicMethods.__base__ is not object:
-                    raise TypeError(
-                        "the 'PublicMethods' variable must be a subclass of 'NameRecord' "
-                        "or an immediate subclass of object that acts as a placeholder"
-                    )
+        cls.PUBLIC_METHODS_MAP = public_methods_map or None
 
-                bases = (
-                    groupings.NameRecord,
-                    *(
-                        utils.class_getattr_unique(
-                            cls,
-                            "PublicMethods",
-                            filter_func=lambda v: isinstance(v, groupings.NameRecord),
-                            check_dicts_only=True,
-                        ),
-                    ),
-                )
-                cls.PublicMethods = type(
-                    "PublicMethods", bases, dict(**cls.PublicMethods.__dict__)  # type: ignore
-                )
-            elif issubclass(cls.PublicMethods, groupings.OutputNameRecord):
+        # collect the public method maps and 'PublicMethods' records defined
+        # along the MRO in a single pass
+        mro_public_methods = []
+        mro_public_method_records = []
+        seen_ids = set()
+        for base_cls in cls.__mro__:
+            base_dict = base_cls.__dict__
+            methods_map = base_dict.get("PUBLIC_METHODS_MAP")
+            if (
+                methods_map
+                and isinstance(methods_map, dict)
+                and id(methods_map) not in seen_ids
+            ):
+                mro_public_methods.append(methods_map)
+                seen_ids.add(id(methods_map))
+
+            record = base_dict.get("PublicMethods")
+            if (
+                record is not None
+                and isinstance(record, groupings.NameRecord)
+                and id(record) not in seen_ids
+            ):
+                mro_public_method_records.append(record)
+                seen_ids.add(id(record))
+
+        if isinstance(cls.PublicMethods, type):
+            if issubclass(cls.PublicMethods, groupings.OutputNameRecord):
                 raise TypeError(
                     "the 'PublicMethods' variable must not be a subclass of "
                     "'OutputNameRecord', but a subclass of 'NameRecord' "
                     "or an immediate subclass of object that acts as a placeholder"
                 )
 
-        public_methods_map = {}
-        for obj in cls.__dict__.values():
-            if isinstance(obj, FunctionType) and "__public" in obj.__dict__:
-                public_methods_map[obj.__name__] = obj
-
-        cls.PUBLIC_METHODS_MAP = public_methods_map or None
+            _promote_name_record(
+                cls,
+                "PublicMethods",
+                groupings.NameRecord,
+                extra_bases=tuple(mro_public_method_records),
+            )
 
-        mro_public_methods = utils.class_getattr_unique(
-            cls,
-            "PUBLIC_METHODS_MAP",
-            filter_func=lambda v: v and isinstance(v, dict),
-            check_dicts_only=True,
-        )
+        cls._OUTPUT_FIELD_NAMES = _get_enabled_output_names(cls.OutputFields)
+        cls._FROZEN_OUTPUT_FIELD_NAMES = frozenset(cls._OUTPUT_FIELD_NAMES)
+        cls._OUTPUT_QUEUE_NAMES = _get_enabled_output_names(cls.OutputQueues)
+        cls._FROZEN_OUTPUT_QUEUE_NAMES = frozenset(cls._OUTPUT_QUEUE_NAMES)
 
         if mro_public_methods:
             cls.PUBLIC_METHODS_CHAINMAP = FastChainMap(
@@ -1267,10 +1498,30 @@ class JobCore(_JobCore):
                 ignore_defaultdicts=True,
             )
 
+        if cls.PUBLIC_METHODS_CHAINMAP is not None:
+            # flattened view of the public methods as resolved on this class,
+            # along with whether they were marked as disabled and are async
+            public_methods_dict = {}
+            for name in cls.PUBLIC_METHODS_CHAINMAP.keys():
+                func = inspect.getattr_static(cls, name, None)
+                if not isinstance(func, FunctionType):
+                    # overridden by a non-function (e.g. a property or `None`)
+                    # in a subclass, which can't be called as a public method
+                    continue
+
+                disabled, is_async = func.__dict__.get(
+                    "__job_public_method__", (False, inspect.iscoroutinefunction(func))
+                )
+                public_methods_dict[name] = (func, disabled, is_async)
+
+            cls._PUBLIC_METHODS_DICT = public_methods_dict
+            cls._PUBLIC_METHOD_NAMES = tuple(public_methods_dict)
+
     def __init__(self) -> None:
         super().__init__()
 
         self._manager: "proxies.JobManagerProxy | Any" = None
+        self._create_future: Callable[[], asyncio.Future[Any]] = None  # type: ignore
         self._creator: "proxies.JobProxy | None" = None
         self._permission_level: JobPermissionLevels | None = None
 
@@ -1286,36 +1537,26 @@ class JobCore(_JobCore):
         ] | None = None
 
         self._output_queues: dict[str, list[Any]] | None = None
-        self._output_queue_futures: dict[
-            str, list[asyncio.Future[Any] | Any]
+        self._output_queue_futures: dict[str, list[asyncio.Future[Any]]] | None = None
+        self._output_queue_cancel_futures: dict[
+            str, list[asyncio.Future[Any]]
         ] | None = None
+        # waiters to cancel instead of resolve when their output queue is cleared
         self._output_queue_proxies: list["proxies.JobOutputQueueProxy"] | None = None
-
-        if self.OutputFields is not None:
-            self._output_field_futures = {}
-            self._output_fields = {}
-
-        if self.OutputQueues is not None:
-            self._output_queue_proxies = []
-            self._output_queue_futures = {}
-            self._output_queues = {}
+        # output containers are created on first use, if the job class defines them
 
         self._unguard_futures: list[asyncio.Future[bool]] | None = None
         self._guardian: "proxies.JobProxy | None" = None
 
         self._guarded_job_proxies_dict: dict[str, "proxies.JobProxy"] | None = None
         # will be assigned by job manager
+        self._guarded_jobs_view: Mapping[str, "proxies.JobProxy"] | None = None
+        # read-only view of the above, created on first access of `guarded_jobs`
 
-        self._bools &= ~(
-            JF.COMPLETED | JF.TOLD_TO_COMPLETE | JF.KILLED | JF.TOLD_TO_BE_KILLED
-        )  # False
-
-        self._bools &= ~JF.INTERNAL_STARTUP_KILL  # False
-        # needed for jobs to react to killing at
-        # startup, to send them to `on_stop()` immediately
-
-        self._bools &= ~JF.EXTERNAL_STARTUP_KILL  # False
-        # give a job a chance to react to an external startup kill
+        self._bools &= ~_INIT_CLEAR_MASK  # False
+        # clearing the startup kill flags is needed for jobs to react to killing at
+        # startup, to send them to `on_stop()` immediately, and gives a job a chance
+        # to react to an external startup kill
 
         self._alive_since_ts: float | None = None
 
@@ -1338,9 +1579,7 @@ class JobCore(_JobCore):
     @property
     def registered_at(self) -> datetime.datetime | None:
         if self._registered_at_ts:
-            return datetime.datetime.fromtimestamp(
-                self._registered_at_ts, tz=datetime.timezone.utc
-            )
+            return _datetime_from_ts(self._registered_at_ts)
         return None
 
     @property
@@ -1361,7 +1600,16 @@ class JobCore(_JobCore):
     @property
     def guarded_jobs(self) -> Mapping[int, "proxies.JobProxy"]:
         """`Mapping[int, JobProxy]`: A mapping of `JobProxy` objects of the jobs guarded by this job."""
-        return MappingProxyType(self._guarded_job_proxies_dict or {})  # type: ignore
+        view = self._guarded_jobs_view
+        if view is None:
+            if self._guarded_job_proxies_dict is None:
+                return _EMPTY_MAPPING_PROXY
+
+            view = self._guarded_jobs_view = MappingProxyType(
+                self._guarded_job_proxies_dict
+            )
+
+        return view  # type: ignore
 
     @property
     def proxy(self) -> "proxies.JobProxy":
@@ -1374,12 +1622,12 @@ class JobCore(_JobCore):
         self._on_stop_exception = None
 
         self._bools |= JF.IS_STARTING  # True
-        self._bools &= ~(JF.STOPPED | JF.IS_IDLING)  # False
+        self._bools &= ~_START_CLEAR_MASK  # False
 
         self._stopped_since_ts = None
         self._idling_since_ts = None
 
-        self._running_since_ts = time.time()
+        self._running_since_ts = _time()
 
         try:
             if not self._bools & JF.EXTERNAL_STARTUP_KILL:
@@ -1387,9 +1635,7 @@ class JobCore(_JobCore):
 
         except Exception as exc:
             self._on_start_exception = exc
-            self._bools |= (
-                JF.TOLD_TO_STOP | JF.TOLD_TO_STOP_BY_SELF | JF.IS_STOPPING
-            )  # True
+            self._bools |= _SELF_STOP_MASK  # True
             await self.on_start_error(exc)
             self._stop_cleanup(reason=JobStopReasons.Internal.ERROR)
             raise
@@ -1402,34 +1648,19 @@ class JobCore(_JobCore):
         reason: JobStopReasons.Internal | JobStopReasons.External | None = None,
     ) -> None:
         self._last_stopping_reason = (
-            reason
-            if isinstance(reason, (JobStopReasons.External, JobStopReasons.Internal))
-            else self.get_stopping_reason()
+            reason if type(reason) in _STOP_REASON_TYPES else self.get_stopping_reason()
         )
 
         self._loop_count = 0
 
-        self._bools &= ~(
-            JF.SKIP_NEXT_RUN
-            | JF.IS_STARTING
-            | JF.INTERNAL_STARTUP_KILL
-            | JF.EXTERNAL_STARTUP_KILL
-            | JF.TOLD_TO_STOP
-            | JF.TOLD_TO_STOP_BY_SELF
-            | JF.TOLD_TO_STOP_BY_FORCE
-            | JF.IS_STOPPING
-            | JF.TOLD_TO_RESTART
-        )  # False
-
-        if self._bools & (JF.TOLD_TO_COMPLETE | JF.TOLD_TO_BE_KILLED):  # any
+        self._bools &= ~_STOP_CLEANUP_MASK  # False
+
+        if self._bools & _TOLD_TO_FINISH_MASK:  # any
             self._bools &= ~JF.INITIALIZED  # False
             if self._guardian is not None:
-                if self._unguard_futures is not None:
-                    for fut in self._unguard_futures:
-                        if not fut.done():
-                            fut.set_result(True)
-
-                    self._unguard_futures.clear()
+                if futs := self._unguard_futures:
+                    self._unguard_futures = None
+                    _set_futures_result(futs, True)
                     self._manager._self_ungard()
 
             if self._guarded_job_proxies_dict is not None:
@@ -1438,86 +1669,55 @@ class JobCore(_JobCore):
 
                 self._guarded_job_proxies_dict.clear()
 
-            if self.OutputQueues is not None:
-                self._output_queue_proxies.clear()  # type: ignore
+            if self._output_queue_proxies:
+                self._output_queue_proxies.clear()
 
             if self._bools & JF.TOLD_TO_COMPLETE:
                 self._bools &= ~JF.TOLD_TO_COMPLETE  # False
                 self._bools |= JF.COMPLETED  # True
-                self._done_since_ts = time.time()
-
-                self._alive_since_ts = None
-
-                if self._done_futures is not None:
-                    for fut in self._done_futures:
-                        if not fut.done():
-                            fut.set_result(JobStatus.COMPLETED)
-
-                    self._done_futures.clear()
-
-                if self.OutputFields is not None:
-                    for fut_list in self._output_field_futures.values():  # type: ignore
-                        for fut in fut_list:
-                            if not fut.done():
-                                fut.set_result(JobStatus.COMPLETED)
-
-                        fut_list.clear()
-
-                    self._output_field_futures.clear()  # type: ignore
-
-                if self.OutputQueues is not None:
-                    for fut_list in self._output_queue_futures.values():  # type: ignore
-                        for fut, cancel_if_cleared in fut_list:
-                            if not fut.done():
-                                fut.set_result(JobStatus.COMPLETED)
-
-            elif self._bools & JF.TOLD_TO_BE_KILLED:
+                status = JobStatus.COMPLETED
+            else:
                 self._bools &= ~JF.TOLD_TO_BE_KILLED  # False
                 self._bools |= JF.KILLED  # True
-                self._done_since_ts = time.time()
-
-                self._alive_since_ts = None
+                status = JobStatus.KILLED
 
-                if self._done_futures is not None:
-                    for fut in self._done_futures:
-                        if not fut.done():
-                            fut.set_result(JobStatus.KILLED)
+            self._done_since_ts = _time()
+            self._alive_since_ts = None
 
-                    self._done_futures.clear()
+            if futs := self._done_futures:
+                self._done_futures = None
+                _set_futures_result(futs, status)
 
-                if self.OutputFields:
-                    for fut_list in self._output_field_futures.values():  # type: ignore
-                        for fut in fut_list:
-                            if not fut.done():
-                                fut.set_result(JobStatus.KILLED)
+            if fut_lists := self._output_field_futures:
+                self._output_field_futures = None
+                for futs in fut_lists.values():
+                    _set_futures_result(futs, status)
 
-                        fut_list.clear()
+            if fut_lists := self._output_queue_futures:
+                self._output_queue_futures = None
+                for futs in fut_lists.values():
+                    _set_futures_result(futs, status)
 
-                    self._output_field_futures.clear()  # type: ignore
-
-                if self.OutputQueues:
-                    for fut_list in self._output_queue_futures.values():  # type: ignore
-                        for fut, cancel_if_cleared in fut_list:
-                            if not fut.done():
-                                fut.set_result(JobStatus.KILLED)
+            if fut_lists := self._output_queue_cancel_futures:
+                self._output_queue_cancel_futures = None
+                for futs in fut_lists.values():
+                    _set_futures_result(futs, status)
 
         self._bools &= ~JF.IS_IDLING  # False
         self._idling_since_ts = None
 
         self._running_since_ts = None
 
-        if self._bools & (JF.KILLED | JF.COMPLETED):  # any
+        if self._bools & _DONE_MASK:  # any
             self._bools &= ~JF.STOPPED  # False
             self._stopped_since_ts = None
 
-            if self._stop_futures is not None:
-                for fut in self._stop_futures:
-                    if not fut.done():
-                        fut.set_result(
-                            JobStatus.KILLED
-                            if self._bools & JF.KILLED
-                            else JobStatus.COMPLETED
-                        )
+            if futs := self._stop_futures:
+                self._stop_futures = None
+                status = (
+                    JobStatus.KILLED if self._bools & JF.KILLED else JobStatus.COMPLETED
+                )
+                _set_futures_result(futs, status)
 
             if not (self.OutputFields or self.OutputQueues):
                 self._proxy._eject_from_source()
@@ -1526,12 +1726,11 @@ class JobCore(_JobCore):
 
         else:
             self._bools |= JF.STOPPED  # True
-            self._stopped_since_ts = time.time()
+            self._stopped_since_ts = _time()
 
-            if self._stop_futures is not None:
-                for fut in self._stop_futures:
-                    if not fut.done():
-                        fut.set_result(JobStatus.STOPPED)
+            if futs := self._stop_futures:
+                self._stop_futures = None
+                _set_futures_result(futs, JobStatus.STOPPED)
 
     async def _on_stop(self) -> None:
         self._bools |= JF.IS_STOPPING  # True
@@ -1576,7 +1775,8 @@ class JobCore(_JobCore):
         self,
     ) -> JobStopReasons.Internal | JobStopReasons.External | None:
 
-        if not self._bools & JF.IS_STOPPING:
+        bools = self._bools
+        if not bools & JF.IS_STOPPING:
             return
         elif (
             self._on_start_exception
@@ -1586,25 +1786,11 @@ class JobCore(_JobCore):
             return JobStopReasons.Internal.ERROR
         elif self._job_loop.current_loop == self._count:
             return JobStopReasons.Internal.EXECUTION_COUNT_LIMIT
-        elif self._bools & JF.TOLD_TO_STOP_BY_SELF:
-            if self._bools & JF.TOLD_TO_RESTART:
-                return JobStopReasons.Internal.RESTART
-            elif self._bools & JF.TOLD_TO_COMPLETE:
-                return JobStopReasons.Internal.COMPLETION
-            elif self._bools & JF.TOLD_TO_BE_KILLED:
-                return JobStopReasons.Internal.KILLING
-            else:
-                return JobStopReasons.Internal.UNSPECIFIC
-        else:
-            if self._bools & JF.TOLD_TO_RESTART:
-                return JobStopReasons.External.RESTART
-            elif self._bools & JF.TOLD_TO_BE_KILLED:
-                return JobStopReasons.External.KILLING
-            else:
-                return JobStopReasons.External.UNKNOWN
+
+        return _STOPPING_REASON_TABLE[bools & _STOPPING_REASON_MASK]
 
     def _start(self) -> bool:
-        if self.done():
+        if self._bools & _DONE_MASK:  # any
             raise JobIsDone("This job object is already done.")
 
         elif not self.is_running():
@@ -1619,11 +1805,9 @@ class JobCore(_JobCore):
         This method to initializes a job using the `_on_init` method
         of the base class.
         """
-        if self._manager is not None and not self._bools & (
-            JF.KILLED | JF.COMPLETED
-        ):  # not any
+        if self._manager is not None and not self._bools & _DONE_MASK:  # not any
             await self._on_init()
-            self._alive_since_ts = time.time()
+            self._alive_since_ts = _time()
             return True
 
         return False
@@ -1641,16 +1825,11 @@ class JobCore(_JobCore):
             and task is not None
             and not task.done()
         ):
-
-            def restart_when_over(fut):
-                task.remove_done_callback(restart_when_over)
-                self._start()
-
-            if not self._bools & (JF.TOLD_TO_STOP | JF.IS_STOPPING):  # not any
+            if not self._bools & _STOP_PENDING_MASK:  # not any
                 # forceful restart
                 self.stop(force=True)
 
-            task.add_done_callback(restart_when_over)
+            task.add_done_callback(self._restart_when_over)
             self._bools |= JF.TOLD_TO_RESTART  # True
             return True
 
@@ -1669,16 +1848,11 @@ class JobCore(_JobCore):
             and task is not None
             and not task.done()
         ):
-
-            def restart_when_over(fut):
-                task.remove_done_callback(restart_when_over)
-                self._start_external()
-
-            if not self._bools & (JF.TOLD_TO_STOP | JF.IS_STOPPING):  # not any
+            if not self._bools & _STOP_PENDING_MASK:  # not any
                 # forceful restart
                 self._stop_external(force=True)
 
-            task.add_done_callback(restart_when_over)
+            task.add_done_callback(self._restart_external_when_over)
             self._bools |= JF.TOLD_TO_RESTART  # True
             return True
 
@@ -1700,7 +1874,7 @@ class JobCore(_JobCore):
             Whether the call was successful.
         """
 
-        if not self._bools & (JF.TOLD_TO_BE_KILLED | JF.TOLD_TO_COMPLETE):  # not any
+        if not self._bools & _TOLD_TO_FINISH_MASK:  # not any
             if not self._bools & JF.IS_STOPPING:
                 self.stop(force=True)
 
@@ -1720,7 +1894,7 @@ class JobCore(_JobCore):
             Whether this method was successful.
         """
 
-        if not self._bools & (JF.TOLD_TO_BE_KILLED | JF.TOLD_TO_COMPLETE):  # not any
+        if not self._bools & _TOLD_TO_FINISH_MASK:  # not any
             if self._kill_raw():
                 self._bools |= JF.TOLD_TO_BE_KILLED  # True
                 return True
@@ -1761,7 +1935,7 @@ class JobCore(_JobCore):
             Whether this method was successful.
         """
 
-        if not self._bools & (JF.TOLD_TO_BE_KILLED | JF.TOLD_TO_COMPLETE):  # not any
+        if not self._bools & _TOLD_TO_FINISH_MASK:  # not any
             if self._kill_external_raw(awaken=awaken):
                 self._bools |= JF.TOLD_TO_BE_KILLED  # True
                 return True
@@ -1793,26 +1967,27 @@ class JobCore(_JobCore):
         """`bool`: Whether this job is currently alive
         (initialized and bound to a job manager, not completed or killed).
         """
+        bools = self._bools
         return bool(
             self._manager is not None
-            and self._bools & JF.INITIALIZED
-            and not self._bools & (JF.KILLED | JF.COMPLETED)  # not any
+            and bools & JF.INITIALIZED
+            and not bools & _DONE_MASK  # not any
         )
 
     def alive_since(self) -> datetime.datetime | None:
         """`datetime.datetime | None`: The last time at which this job object became alive, if available."""
         if self._alive_since_ts:
-            return datetime.datetime.fromtimestamp(
-                self._alive_since_ts, tz=datetime.timezone.utc
-            )
+            return _datetime_from_ts(self._alive_since_ts)
         return None
 
     def is_running(self) -> bool:
         """`bool`: Whether this job is currently running (alive and not stopped)."""
-        return (
-            self.alive()
+        bools = self._bools
+        return bool(
+            self._manager is not None
+            and bools & JF.INITIALIZED
+            and not bools & _STOPPED_OR_DONE_MASK  # not any
             and self._job_loop.is_running()
-            and not self._bools & JF.STOPPED
         )
 
     def killed(self) -> bool:
@@ -1821,9 +1996,7 @@ class JobCore(_JobCore):
 
     def is_being_killed(self) -> bool:
         """`bool`: Whether this job is being killed."""
-        return (
-            self._bools & (TRUE := JF.IS_STOPPING | JF.TOLD_TO_BE_KILLED) == TRUE
-        )  # all
+        return self._bools & _BEING_KILLED_MASK == _BEING_KILLED_MASK  # all
 
     def is_being_startup_killed(self) -> bool:
         """`bool`: Whether this job was started up only for it to be killed.
@@ -1831,10 +2004,8 @@ class JobCore(_JobCore):
         due to that, and can be checked for within `on_stop()`.
         """
         return (
-            self._bools
-            & (TRUE := JF.EXTERNAL_STARTUP_KILL | JF.IS_STOPPING | JF.TOLD_TO_BE_KILLED)
-            == TRUE
-        )
+            self._bools & _BEING_STARTUP_KILLED_MASK == _BEING_STARTUP_KILLED_MASK
+        )  # all
 
     def completed(self) -> bool:
         """`bool`: Whether this job completed successfully."""
@@ -1842,20 +2013,16 @@ class JobCore(_JobCore):
 
     def is_completing(self) -> bool:
         """`bool`: Whether this job is currently completing."""
-        return (
-            self._bools & (TRUE := JF.IS_STOPPING | JF.TOLD_TO_COMPLETE) == TRUE
-        )  # all
+        return self._bools & _COMPLETING_MASK == _COMPLETING_MASK  # all
 
     def done(self) -> bool:
         """`bool`: Whether this job was killed or has completed."""
-        return bool(self._bools & (JF.KILLED | JF.COMPLETED))  # any
+        return bool(self._bools & _DONE_MASK)  # any
 
     def done_since(self) -> datetime.datetime | None:
         """`datetime.datetime | None`: The time at which this job object completed successfully or was killed, if available."""
         if self._done_since_ts is not None:
-            return datetime.datetime.fromtimestamp(
-                self._done_since_ts, tz=datetime.timezone.utc
-            )
+            return _datetime_from_ts(self._done_since_ts)
         return None
 
     killed_at = property(fget=done_since)
@@ -1908,19 +2075,17 @@ class JobCore(_JobCore):
             The timeout was exceeded.
         """
 
-        if not self.is_running():
+        if not self.is_running():  # running jobs can't be done
             raise JobNotRunning("This job object is not running")
-        elif self.done():
-            raise JobIsDone("This job object is already done")
 
-        fut = self._manager._loop.create_future()
+        fut = self._create_future()
 
         if self._stop_futures is None:
             self._stop_futures = []
 
-        self._stop_futures.append(fut)
+        _add_waiter(self._stop_futures, fut)
 
-        return asyncio.wait_for(fut, timeout)
+        return _wait_for(fut, timeout)
 
     def await_done(
         self, timeout: float | None = None, cancel_if_killed: bool = False
@@ -1948,17 +2113,17 @@ class JobCore(_JobCore):
         asyncio.CancelledError
             The job was killed.
         """
-        if self.done():
+        if self._bools & _DONE_MASK:  # any
             raise JobIsDone("This job object is already done")
 
-        fut = self._manager._loop.create_future()
+        fut = self._create_future()
 
         if self._done_futures is None:
             self._done_futures = []
 
-        self._done_futures.append(fut)
+        _add_waiter(self._done_futures, fut)
 
-        return asyncio.wait_for(fut, timeout)
+        return _wait_for(fut, timeout)
 
     def await_unguard(self, timeout: float | None = None) -> Coroutine[Any, Any, bool]:
         """Wait for this job object to be unguarded using the
@@ -1988,21 +2153,22 @@ class JobCore(_JobCore):
             The job was killed.
         """
 
-        if not self.alive():
-            raise JobNotAlive("this job object is not alive")
-        elif self.done():
+        bools = self._bools
+        if bools & _DONE_MASK:  # any
             raise JobIsDone("this job object is already done")
-        elif not self._guardian is not None:
+        elif self._manager is None or not bools & JF.INITIALIZED:
+            raise JobNotAlive("this job object is not alive")
+        elif self._guardian is None:
             raise JobStateError("this job object is not being guarded by a job")
 
-        fut = self._manager._loop.create_future()
+        fut = self._create_future()
 
         if self._unguard_futures is None:
             self._unguard_futures = []
 
-        self._unguard_futures.append(fut)
+        _add_waiter(self._unguard_futures, fut)
 
-        return asyncio.wait_for(fut, timeout)
+        return _wait_for(fut, timeout)
 
     def get_output_queue_proxy(self) -> "proxies.JobOutputQueueProxy":
         """Get a job output queue proxy object for more convenient
@@ -2025,16 +2191,51 @@ class JobCore(_JobCore):
 
         if not self.alive():
             raise JobNotAlive("this job object is not alive")
-        elif self.done():
+        elif self._bools & _DONE_MASK:  # any
             raise JobIsDone("this job object is already done")
 
-        if not (self.OutputQueues is None or self._output_queue_proxies is None):
+        if self.OutputQueues is not None:
             output_queue_proxy = proxies.JobOutputQueueProxy(self)  # type: ignore
+            if self._output_queue_proxies is None:
+                self._output_queue_proxies = []
+
             self._output_queue_proxies.append(output_queue_proxy)
             return output_queue_proxy
 
         raise TypeError("this job object does not support output queues")
 
+    @classmethod
+    def _get_output_name_error(
+        cls, output_type: Literal["field", "queue"], name: str
+    ) -> Exception:
+        # build the exception for an unsupported output field or queue name,
+        # kept out of the output name verification methods
+        namespace_name = "OutputFields" if output_type == "field" else "OutputQueues"
+        namespace = getattr(cls, namespace_name)
+
+        if namespace is None:
+            return TypeError(
+                f"'{cls.__qualname__}' class does not"
+                f" implement or inherit an '{namespace_name}' class namespace"
+            )
+
+        elif not isinstance(name, str):
+            return TypeError(
+                f"'{output_type}_name' argument must be of type str,"
+                f" not {name.__class__.__name__}"
+            )
+
+        elif getattr(namespace, name, None) == "DISABLED":
+            return ValueError(
+                f"the output {output_type} name '{name}' has been marked as disabled"
+            )
+
+        return LookupError(
+            f"{output_type} name '{name}' is not defined in"
+            f" '{namespace_name}' class namespace of "
+            f"'{cls.__qualname__}' class"
+        )
+
     @classmethod
     def verify_output_field_support(
         cls, field_name: str, raise_exceptions=False
@@ -2065,40 +2266,13 @@ class JobCore(_JobCore):
             The specified field name is not defined by this job.
         """
 
-        if cls.OutputFields is None:
-            if raise_exceptions:
-                raise TypeError(
-                    f"'{cls.__qualname__}' class does not"
-                    f" implement or inherit an 'OutputFields' class namespace"
-                )
-            return False
-
-        value = getattr(cls.OutputFields, field_name, None)
-
-        if value is None:
-            if raise_exceptions:
-                raise (
-                    LookupError(
-                        f"field name '{field_name}' is not defined in"
-                        f" 'OutputFields' class namespace of "
-                        f"'{cls.__qualname__}' class"
-                    )
-                    if isinstance(field_name, str)
-                    else TypeError(
-                        f"'field_name' argument must be of type str,"
-                        f" not {field_name.__class__.__name__}"
-                    )
-                )
-            return False
+        if field_name in cls._FROZEN_OUTPUT_FIELD_NAMES:
+            return True
 
-        elif value == "DISABLED":
-            if raise_exceptions:
-                raise ValueError(
-                    f"the output field name '{field_name}' has been marked as disabled"
-                )
-            return False
+        elif raise_exceptions:
+            raise cls._get_output_name_error("field", field_name)
 
-        return True
+        return False
 
     @classmethod
     def verify_output_queue_support(
@@ -2130,40 +2304,13 @@ class JobCore(_JobCore):
         LookupError
             The specified queue name is not defined by this job.
         """
-        if cls.OutputQueues is None:
-            if raise_exceptions:
-                raise TypeError(
-                    f"'{cls.__qualname__}' class does not"
-                    f" implement or inherit an 'OutputQueues' class namespace"
-                )
-            return False
-
-        value = getattr(cls.OutputQueues, queue_name, None)
-
-        if value is None:
-            if raise_exceptions:
-                raise (
-                    LookupError(
-                        f"queue name '{queue_name}' is not defined in"
-                        f" 'OutputQueues' class namespace of "
-                        f"'{cls.__qualname__}' class"
-                    )
-                    if isinstance(queue_name, str)
-                    else TypeError(
-                        f"'queue_name' argument must be of type str,"
-                        f" not {queue_name.__class__.__name__}"
-                    )
-                )
-            return False
+        if queue_name in cls._FROZEN_OUTPUT_QUEUE_NAMES:
+            return True
 
-        elif value == "DISABLED":
-            if raise_exceptions:
-                raise ValueError(
-                    f"the output queue name '{queue_name}' has been marked as disabled"
-                )
-            return False
+        elif raise_exceptions:
+            raise cls._get_output_name_error("queue", queue_name)
 
-        return True
+        return False
 
     def set_output_field(self, field_name: str, value: Any) -> None:
         """Set the specified output field to have the given value,
@@ -2186,11 +2333,11 @@ class JobCore(_JobCore):
         """
 
         self.verify_output_field_support(field_name, raise_exceptions=True)
-        assert not (self._output_fields is None or self._output_field_futures is None)
 
-        field_value = self._output_fields.get(field_name, UNSET)
+        if self._output_fields is None:
+            self._output_fields = {}
 
-        if field_value is not UNSET:
+        elif field_name in self._output_fields:
             raise JobOutputError(
                 "An output field value has already been set for the field"
                 f" '{field_name}'"
@@ -2198,12 +2345,9 @@ class JobCore(_JobCore):
 
         self._output_fields[field_name] = value
 
-        if field_name in self._output_field_futures:
-            for fut in self._output_field_futures[field_name]:
-                if not fut.done():
-                    fut.set_result(value)
-
-            self._output_field_futures[field_name].clear()
+        futs = self._output_field_futures
+        if futs and (fut_list := futs.pop(field_name, None)):
+            _set_futures_result(fut_list, value)
 
     def push_output_queue(self, queue_name: str, value: Any) -> None:
         """Add a value to the specified output queue,
@@ -2227,25 +2371,25 @@ class JobCore(_JobCore):
         """
 
         self.verify_output_queue_support(queue_name, raise_exceptions=True)
-        assert not (
-            self._output_queues is None
-            or self._output_queue_proxies is None
-            or self._output_queue_futures is None
-        )
-        if queue_name not in self._output_queues:
-            self._output_queues[queue_name] = queue = []
+
+        if self._output_queues is None:
+            self._output_queues = {}
+
+        queue_entries = self._output_queues.get(queue_name)
+        if queue_entries is None:
+            self._output_queues[queue_name] = queue_entries = []
             for proxy in self._output_queue_proxies or ():
-                proxy._new_output_queue_alert(queue_name, queue)
+                proxy._new_output_queue_alert(queue_name, queue_entries)
 
-        queue_entries: list = self._output_queues[queue_name]
         queue_entries.append(value)
 
-        if queue_name in self._output_queue_futures:
-            for fut, cancel_if_cleared in self._output_queue_futures[queue_name]:
-                if not fut.done():
-                    fut.set_result(value)
+        futs = self._output_queue_futures
+        if futs and (fut_list := futs.pop(queue_name, None)):
+            _set_futures_result(fut_list, value)
 
-            self._output_queue_futures[queue_name].clear()
+        futs = self._output_queue_cancel_futures
+        if futs and (fut_list := futs.pop(queue_name, None)):
+            _set_futures_result(fut_list, value)
 
     def get_output_field(self, field_name: str, default=UNSET, /) -> Any:
         """Get the value of a specified output field.
@@ -2275,36 +2419,19 @@ class JobCore(_JobCore):
             An output field value is not set.
         """
 
-        if self.OutputFields is None:
-            if default is UNSET:
-                self.verify_output_field_support(field_name, raise_exceptions=True)
-            return default
-
-        elif getattr(self.OutputFields, field_name, None) in (None, "DISABLED"):
-            if default is UNSET:
-                self.verify_output_field_support(field_name, raise_exceptions=True)
-            return default
-
-        assert self._output_fields is not None
-        if field_name not in self._output_fields:
-            if default is UNSET:
-                raise JobOutputError(
-                    "An output field value has not been set for the field"
-                    f" '{field_name}'"
-                )
-            return default
-
-        old_field_data_list: list = self._output_fields[field_name]
+        if self._output_fields is not None:
+            # only supported field names can have been set
+            field_value = self._output_fields.get(field_name, UNSET)
+            if field_value is not UNSET:
+                return field_value
 
-        if not old_field_data_list[1]:
-            if default is UNSET:
-                raise JobOutputError(
-                    "An output field value has not been set for the field"
-                    f" '{field_name}'"
-                )
+        if default is not UNSET:
             return default
 
-        return old_field_data_list[0]
+        self.verify_output_field_support(field_name, raise_exceptions=True)
+        raise JobOutputError(
+            f"An output field value has not been set for the field '{field_name}'"
+        )
 
     def get_output_queue_contents(self, queue_name: str) -> list[Any]:
         """Get a list of all values present in the specified output queue.
@@ -2338,16 +2465,14 @@ class JobCore(_JobCore):
 
         self.verify_output_queue_support(queue_name, raise_exceptions=True)
 
-        assert self._output_queues is not None
-        if queue_name not in self._output_queues:
-            raise JobOutputError(f"The specified output queue '{queue_name}' is empty")
-
-        queue_data_list: list = self._output_queues[queue_name]
+        queue_data_list: list | None = None
+        if self._output_queues is not None:
+            queue_data_list = self._output_queues.get(queue_name)
 
         if not queue_data_list:
             raise JobOutputError(f"The specified output queue '{queue_name}' is empty")
 
-        return queue_data_list[:]
+        return queue_data_list.copy()
 
     def clear_output_queue(self, queue_name: str) -> None:
         """Clear all values in the specified output queue.
@@ -2359,24 +2484,22 @@ class JobCore(_JobCore):
         """
         self.verify_output_queue_support(queue_name, raise_exceptions=True)
 
-        assert not (
-            self._output_queues is None
-            or self._output_queue_futures is None
-            or self._output_queue_proxies is None
-        )
-
-        if queue_name in self._output_queues:
-            for output_queue_proxy in self._output_queue_proxies:
+        output_queues = self._output_queues
+        if output_queues is not None and queue_name in output_queues:
+            for output_queue_proxy in self._output_queue_proxies or ():
                 output_queue_proxy._output_queue_clear_alert(queue_name)
 
-            for fut, cancel_if_cleared in self._output_queue_futures[queue_name]:
-                if not fut.done():
-                    if cancel_if_cleared:
+            futs = self._output_queue_futures
+            if futs and (fut_list := futs.pop(queue_name, None)):
+                _set_futures_result(fut_list, JobStatus.OUTPUT_QUEUE_CLEARED)
+
+            futs = self._output_queue_cancel_futures
+            if futs and (fut_list := futs.pop(queue_name, None)):
+                for fut in fut_list:
+                    if not fut.done():
                         fut.cancel(f"The job output queue '{queue_name}' was cleared")
-                    else:
-                        fut.set_result(JobStatus.OUTPUT_QUEUE_CLEARED)
 
-            self._output_queues[queue_name].clear()
+            output_queues[queue_name].clear()
 
     @classmethod
     def get_output_field_names(cls) -> tuple[str]:
@@ -2389,10 +2512,7 @@ class JobCore(_JobCore):
             A tuple of the supported output fields.
         """
 
-        if cls.OutputFields is None:
-            return tuple()
-
-        return cls.OutputFields.__record_names__
+        return cls._OUTPUT_FIELD_NAMES
 
     @classmethod
     def get_output_queue_names(cls) -> tuple[str]:
@@ -2404,10 +2524,7 @@ class JobCore(_JobCore):
         tuple[str]
             A tuple of the supported output queues.
         """
-        if cls.OutputQueues is None:
-            return tuple()
-
-        return cls.OutputQueues.__record_names__
+        return cls._OUTPUT_QUEUE_NAMES
 
     @classmethod
     def has_output_field_name(cls, field_name: str) -> bool:
@@ -2425,13 +2542,13 @@ class JobCore(_JobCore):
             ``True`` if condition is met, ``False`` otherwise.
         """
 
-        if not isinstance(field_name, str):
-            raise TypeError(
-                f"'field_name' argument must be of type str,"
-                f" not {field_name.__class__.__name__}"
-            )
+        if isinstance(field_name, str):
+            return field_name in cls._FROZEN_OUTPUT_FIELD_NAMES
 
-        return cls.verify_output_field_support(field_name)
+        raise TypeError(
+            f"'field_name' argument must be of type str,"
+            f" not {field_name.__class__.__name__}"
+        )
 
     @classmethod
     def has_output_queue_name(cls, queue_name: str) -> bool:
@@ -2449,13 +2566,13 @@ class JobCore(_JobCore):
             ``True`` if condition is met, ``False`` otherwise.
         """
 
-        if not isinstance(queue_name, str):
-            raise TypeError(
-                f"'queue_name' argument must be of type str,"
-                f" not {queue_name.__class__.__name__}"
-            )
+        if isinstance(queue_name, str):
+            return queue_name in cls._FROZEN_OUTPUT_QUEUE_NAMES
 
-        return cls.verify_output_queue_support(queue_name)
+        raise TypeError(
+            f"'queue_name' argument must be of type str,"
+            f" not {queue_name.__class__.__name__}"
+        )
 
     def output_field_is_set(self, field_name: str) -> bool:
         """Whether a value for the specified output field
@@ -2481,9 +2598,8 @@ class JobCore(_JobCore):
         """
 
         self.verify_output_field_support(field_name, raise_exceptions=True)
-        field_value = self._output_fields.get(field_name, UNSET)  # type: ignore
-
-        return field_value is not UNSET
+        output_fields = self._output_fields
+        return output_fields is not None and field_name in output_fields
 
     def output_queue_is_empty(self, queue_name: str) -> bool:
         """Whether the specified output queue is empty.
@@ -2509,7 +2625,8 @@ class JobCore(_JobCore):
 
         self.verify_output_queue_support(queue_name, raise_exceptions=True)
 
-        return not self._output_queues.get(queue_name, None)  # type: ignore
+        output_queues = self._output_queues
+        return output_queues is None or not output_queues.get(queue_name, None)
 
     def await_output_field(
         self, field_name: str, timeout: float | None = None
@@ -2547,19 +2664,18 @@ class JobCore(_JobCore):
         """
 
         self.verify_output_field_support(field_name, raise_exceptions=True)
-        assert self._output_field_futures is not None
 
-        if self.done():
+        if self._bools & _DONE_MASK:  # any
             raise JobIsDone("This job object is already done")
 
-        fut = self._manager._loop.create_future()
+        fut = self._create_future()
 
-        if field_name not in self._output_field_futures:
-            self._output_field_futures[field_name] = []
+        if self._output_field_futures is None:
+            self._output_field_futures = {}
 
-        self._output_field_futures[field_name].append(fut)
+        _add_waiter(self._output_field_futures.setdefault(field_name, []), fut)
 
-        return asyncio.wait_for(fut, timeout=timeout)
+        return _wait_for(fut, timeout)
 
     def await_output_queue_add(
         self,
@@ -2613,18 +2729,22 @@ class JobCore(_JobCore):
 
         self.verify_output_queue_support(queue_name, raise_exceptions=True)
 
-        if self.done():
+        if self._bools & _DONE_MASK:  # any
             raise JobIsDone("This job object is already done")
 
-        assert self._output_queue_futures is not None
-
-        if queue_name not in self._output_queue_futures:
-            self._output_queue_futures[queue_name] = []
+        if cancel_if_cleared:
+            if self._output_queue_cancel_futures is None:
+                self._output_queue_cancel_futures = {}
+            fut_lists = self._output_queue_cancel_futures
+        else:
+            if self._output_queue_futures is None:
+                self._output_queue_futures = {}
+            fut_lists = self._output_queue_futures
 
-        fut = self._manager._loop.create_future()
-        self._output_queue_futures[queue_name].append((fut, cancel_if_cleared))
+        fut = self._create_future()
+        _add_waiter(fut_lists.setdefault(queue_name, []), fut)
 
-        return asyncio.wait_for(fut, timeout=timeout)
+        return _wait_for(fut, timeout)
 
     @classmethod
     def verify_public_method_suppport(
@@ -2655,7 +2775,12 @@ class JobCore(_JobCore):
             No public method under the specified name is defined by this job.
         """
 
-        if cls.PUBLIC_METHODS_CHAINMAP is None:
+        entry = cls._PUBLIC_METHODS_DICT.get(method_name)
+
+        if entry is not None and not entry[1]:
+            return True
+
+        elif cls.PUBLIC_METHODS_CHAINMAP is None:
             if raise_exceptions:
                 raise TypeError(
                     f"'{cls.__qualname__}' class does not"
@@ -2663,7 +2788,7 @@ class JobCore(_JobCore):
                 )
             return False
 
-        elif method_name not in cls.PUBLIC_METHODS_CHAINMAP:
+        elif entry is None:
             if raise_exceptions:
                 raise (
                     LookupError(
@@ -2678,15 +2803,12 @@ class JobCore(_JobCore):
                 )
             return False
 
-        elif getattr(cls, method_name).__dict__.get("__disabled", False):
-            if raise_exceptions:
-                raise ValueError(
-                    f"the public method of this job of class '{cls.__qualname__} "
-                    f"under the name '{method_name}' has been marked as disabled"
-                )
-            return False
-
-        return True
+        if raise_exceptions:
+            raise ValueError(
+                f"the public method of this job of class '{cls.__qualname__} "
+                f"under the name '{method_name}' has been marked as disabled"
+            )
+        return False
 
     @classmethod
     def get_public_method_names(cls) -> tuple[str]:
@@ -2697,10 +2819,7 @@ class JobCore(_JobCore):
         tuple[str]
             A tuple of the names of the supported methods.
         """
-        if cls.PUBLIC_METHODS_CHAINMAP is None:
-            return tuple()
-
-        return tuple(cls.PUBLIC_METHODS_CHAINMAP.keys())
+        return cls._PUBLIC_METHOD_NAMES
 
     @classmethod
     def has_public_method_name(cls, method_name: str) -> bool:
@@ -2742,7 +2861,7 @@ class JobCore(_JobCore):
 
         cls.verify_public_method_suppport(method_name, raise_exceptions=True)
 
-        return inspect.iscoroutinefunction(getattr(cls, method_name))
+        return cls._PUBLIC_METHODS_DICT[method_name][2]
 
     def run_public_method(self, method_name, *args, **kwargs) -> Any:
         """Run a public method under the specified name and return the
@@ -2763,53 +2882,38 @@ class JobCore(_JobCore):
             The result of the call.
         """
 
-        self.verify_public_method_suppport(method_name, raise_exceptions=True)
-        return getattr(self.__class__, method_name)(self, *args, **kwargs)
+        entry = self._PUBLIC_METHODS_DICT.get(method_name)
+        if entry is None or entry[1]:
+            self.verify_public_method_suppport(method_name, raise_exceptions=True)
+
+        return entry[0](self, *args, **kwargs)  # type: ignore
 
     def status(self) -> JobStatus:
         """`JobStatus`: Get the job status of this job as a value from the
         `JobStatus` enum.
         """
-        output = JobStatus.FRESH
-        if self.alive():
-            if self.is_running():
-                if self.is_starting():
-                    output = JobStatus.STARTING
-                elif self.is_idling():
-                    output = JobStatus.IDLING
-                elif self.is_stopping():
-                    if self.is_completing():
-                        output = JobStatus.COMPLETING
-                    elif self.is_being_killed():
-                        output = JobStatus.BEING_KILLED
-                    elif self.is_restarting():
-                        output = JobStatus.RESTARTING
-                    else:
-                        output = JobStatus.STOPPING
-                else:
-                    output = JobStatus.RUNNING
-            elif self.stopped():
-                output = JobStatus.STOPPED
-            elif self.initialized():
-                output = JobStatus.INITIALIZED
-
-        elif self.completed():
-            output = JobStatus.COMPLETED
-        elif self.killed():
-            output = JobStatus.KILLED
-
-        return output
+        bools = self._bools
+        if bools & _DONE_MASK:  # any
+            return JobStatus.COMPLETED if bools & JF.COMPLETED else JobStatus.KILLED
+        elif self._manager is None or not bools & JF.INITIALIZED:
+            return JobStatus.FRESH
+        elif bools & JF.STOPPED:
+            return JobStatus.STOPPED
+        elif self._job_loop.is_running():
+            return _RUNNING_STATUS_TABLE[bools & _RUNNING_STATUS_MASK]
+
+        return JobStatus.INITIALIZED
 
     def __str__(self) -> str:
+        permission_level_str = (
+            ""
+            if self._permission_level is None
+            else f"permission_level={self._permission_level.name} "
+        )
         return (
             f"<{self.__class__.__qualname__} "
-            + f"(id={self._runtime_id} created_at={self.created_at} "
-            + (
-                f"permission_level={self._permission_level.name} "
-                if self._permission_level is not None
-                else ""
-            )
-            + f"status={self.status().name})>"
+            f"(id={self._runtime_id} created_at={self.created_at} "
+            f"{permission_level_str}status={self.status().name})>"
         )
 
 
@@ -2840,6 +2944,14 @@ class JobMixin(JobCore):
 
 
 class JobBase(JobCore):
+    """The base class of job classes that support job mixins.
+    `JobCore`, `JobMixin`, `JobBase` and `ManagedJobBase` declare `__slots__`,
+    so subclasses that also declare them (e.g. as an empty tuple) will not
+    give their instances a `__dict__`. `BaseEventJobMixin` and its subclasses
+    don't declare `__slots__`, so instances of job classes that inherit from
+    them always have a `__dict__`.
+    """
+
     __slots__ = ("_mixin_task_dict", "_mixin_future_dict")
 
     JOB_MIXIN_CLASSES: frozenset[type[JobMixin]] = frozenset()
@@ -2926,7 +3038,7 @@ class JobBase(JobCore):
               being handled.
         """
 
-        if self.done():
+        if self._bools & _DONE_MASK:  # any
             raise JobIsDone("This job object is already done")
         elif not self.is_running():
             raise JobNotRunning("This job object is not running")
@@ -2971,7 +3083,7 @@ class JobBase(JobCore):
             The given mixin classes are already being handled.
         """
 
-        if self.done():
+        if self._bools & _DONE_MASK:  # any
             raise JobIsDone("This job object is already done")
         elif not self.is_running():
             raise JobNotRunning("This job object is not running")
@@ -3086,7 +3198,7 @@ class JobBase(JobCore):
                 mixin_cls in self._mixin_task_dict
                 and not self._mixin_task_dict[mixin_cls].done()
             ):  # mixin tasks are currently running
-                fut = self._manager._loop.create_future()
+                fut = self._create_future()
 
                 if mixin_cls not in self._mixin_future_dict:
                     self._mixin_future_dict[mixin_cls] = []
@@ -3294,9 +3406,7 @@ class ManagedJobBase(JobBase):
         )
         self._count = self.DEFAULT_COUNT if count is UNSET else count
 
-        reconnect = not not (
-            self.DEFAULT_RECONNECT if reconnect is UNSET else reconnect
-        )
+        reconnect = bool(self.DEFAULT_RECONNECT if reconnect is UNSET else reconnect)
 
         self._time = self.DEFAULT_TIME if time is UNSET else time
 
@@ -3377,24 +3487,21 @@ class ManagedJobBase(JobBase):
         pass
 
     async def _on_run(self) -> None:
-        if self._bools & JF.EXTERNAL_STARTUP_KILL:
-            self._kill_external_raw()
+        bools = self._bools
+        if bools & _SKIP_RUN_MASK:  # any
+            if bools & JF.EXTERNAL_STARTUP_KILL:
+                self._kill_external_raw()
+            elif bools & JF.INTERNAL_STARTUP_KILL:
+                self._kill_raw()
             return
 
-        elif self._bools & JF.INTERNAL_STARTUP_KILL:
-            self._kill_raw()
-            return
-
-        elif self._bools & JF.SKIP_NEXT_RUN:
-            return
-
-        self._bools &= ~JF.IS_IDLING  # False
+        self._bools = bools & ~JF.IS_IDLING  # False
         self._idling_since_ts = None
 
         await self.on_run()
         if self._interval_secs:  # There is a task loop interval set
             self._bools |= JF.IS_IDLING  # True
-            self._idling_since_ts = time.time()
+            self._idling_since_ts = _time()
 
         self._loop_count += 1
 
@@ -3425,6 +3532,8 @@ class JobManagerJob(ManagedJobBase):
 
     _RUNTIME_ID = "JobManagerJob-0"
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
         self._runtime_id = "JobManagerJob-0:0"
@@ -116,7 +116,12 @@ class JobLoop(tasks.Loop):
 
                     # sleep after the body of the task for relative time intervals
                     if self._time is discord.utils.MISSING:
-                        await self._try_sleep_until(self._next_iteration)
+                        if self._sleep:
+                            await self._try_sleep_until(self._next_iteration)
+                        else:
+                            # zero intervals only need to yield to the event loop,
+                            # no timer has to be scheduled for that
+                            await asyncio.sleep(0)
 
                     self._current_loop += 1
                     if self._current_loop == self.count:
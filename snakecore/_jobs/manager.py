@@ -42,6 +42,8 @@ from snakecore.utils import FastChainMap
 import snakecore._events as _events
 from . import jobs, loops, mixins
 
+_time = time.time
+
 
 class JobManager:
     """The job manager for all interval and event based jobs.
@@ -541,6 +543,7 @@ class JobManager:
 
         job = cls(*args, **kwargs)
         job._manager = proxies.JobManagerProxy(self, job)
+        job._create_future = self._loop.create_future
         job._creator = _iv._proxy if _iv is not None else None
         proxy = job._proxy
 
@@ -738,7 +741,7 @@ class JobManager:
             )
 
         self._add_job(job, permission_level=permission_level, start=start)  # type: ignore
-        job._registered_at_ts = time.time()
+        job._registered_at_ts = _time()
 
     @overload
     async def create_and_register_job(  # type: ignore
@@ -1711,11 +1714,12 @@ class JobManager:
                 "being guarded by the invoker job object"
             )
 
-        for fut in job._unguard_futures:  # type: ignore
-            if not fut.done():
-                fut.set_result(True)
+        if job._unguard_futures:
+            for fut in job._unguard_futures:
+                if not fut.done():
+                    fut.set_result(True)
 
-        job._unguard_futures.clear()  # type: ignore
+            job._unguard_futures = None
 
     @contextmanager
     def guard_on_job(
@@ -18,6 +18,8 @@ from snakecore.exceptions import JobInitializationError
 from snakecore._jobs.jobs import _JobCore, JobNamespace
 from snakecore._jobs.loops import JobLoop
 
+_time = time.time
+
 
 class MiniJobBase(_JobCore):
     """Base class for interval based mini jobs.
@@ -66,9 +68,7 @@ class MiniJobBase(_JobCore):
         )
         self._count = self.DEFAULT_COUNT if count is UNSET else count
 
-        reconnect = not not (
-            self.DEFAULT_RECONNECT if reconnect is UNSET else reconnect
-        )
+        reconnect = bool(self.DEFAULT_RECONNECT if reconnect is UNSET else reconnect)
 
         self._time = self.DEFAULT_TIME if time is UNSET else time
 
@@ -158,16 +158,17 @@ class MiniJobBase(_JobCore):
         pass
 
     async def _on_run(self):
-        if self._bools & JF.SKIP_NEXT_RUN:
+        bools = self._bools
+        if bools & JF.SKIP_NEXT_RUN:
             return
 
-        self._bools &= ~JF.IS_IDLING  # False
+        self._bools = bools & ~JF.IS_IDLING  # False
         self._idling_since_ts = None
 
         await self.on_run()
         if self._interval_secs:  # There is a task loop interval set
             self._bools |= JF.IS_IDLING  # True
-            self._idling_since_ts = time.time()
+            self._idling_since_ts = _time()
 
         self._loop_count += 1
 
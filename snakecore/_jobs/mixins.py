@@ -9,11 +9,9 @@ in subclasses using multiple inheritance.
 
 import asyncio
 from collections import deque
-from contextlib import contextmanager
 from contextvars import ContextVar
 import datetime
 import time
-from typing import Any
 
 from snakecore.constants import (
     JobBoolFlags as JF,
@@ -25,6 +23,38 @@ from . import jobs
 from .jobs import JobMixin
 import snakecore._events as _events
 
+_time = time.time
+
+_BLOCK_ON_STOP_MASK = JF.BLOCK_EVENTS_ON_STOP | JF.IS_STOPPING
+# events are dropped while stopping if both of these flags are set
+
+_STOPPED_OR_DONE_MASK = jobs._STOPPED_OR_DONE_MASK
+_STOPPING_REASON_MASK = jobs._STOPPING_REASON_MASK
+_STOPPING_REASON_TABLE = jobs._STOPPING_REASON_TABLE
+
+_EVENT_STOPPING_REASON_MASK = (
+    JF.STOPPING_BY_EMPTY_EVENT_QUEUE | JF.STOPPING_BY_EVENT_DISPATCH_TIMEOUT
+)
+# cleared together whenever an event job is (re)started or stopped
+
+
+class _BlockedEventQueue:
+    """The context manager returned by `BaseEventJobMixin.blocked_event_queue()`.
+    A plain class is used instead of `contextlib.contextmanager`, to avoid
+    creating a generator on every `with` statement.
+    """
+
+    __slots__ = ("_job",)
+
+    def __init__(self, job: "BaseEventJobMixin") -> None:
+        self._job = job
+
+    def __enter__(self) -> None:
+        self._job._bools &= ~JF.EVENT_DISPATCH_ENABLED  # False
+
+    def __exit__(self, *args) -> None:
+        self._job._bools |= JF.EVENT_DISPATCH_ENABLED  # True
+
 
 class BaseEventJobMixin(JobMixin):
     """A mixin class that enables jobs to receive events from their job manager.
@@ -41,6 +71,9 @@ class BaseEventJobMixin(JobMixin):
     DEFAULT_MAX_EVENT_QUEUE_SIZE: int | None = None
 
     DEFAULT_ALLOW_EVENT_QUEUE_OVERFLOW: bool = False
+    """Whether to drop the oldest queued event instead of a newly dispatched one
+    when the event queue is full. Defaults to False.
+    """
 
     DEFAULT_BLOCK_EVENTS_ON_STOP: bool = True
     DEFAULT_START_ON_EVENT_DISPATCH: bool = False
@@ -57,59 +90,60 @@ class BaseEventJobMixin(JobMixin):
     Defaults to False.
     """
 
+    _DEFAULT_EVENT_BOOLS: int = 0
+    # the initial event job flags derived from the `DEFAULT_*` class variables
+
     # __slots__ = (
     #     "_event_queue",
     #     "_max_event_queue_size",
     #     "_event_queue_futures",
+    #     "_dropped_event_count",
     # )
 
-    def __init__(self, **kwargs) -> None:
-        super().__init__(**kwargs)
-        max_event_queue_size = self.DEFAULT_MAX_EVENT_QUEUE_SIZE
+    def __init_subclass__(cls, class_uuid: str | None = None) -> None:
+        super().__init_subclass__(class_uuid=class_uuid)
 
-        if isinstance(max_event_queue_size, (int, float)):
-            self._max_event_queue_size = int(max_event_queue_size)
-            if self._max_event_queue_size <= 0:
-                self._max_event_queue_size = None
-        else:
-            self._max_event_queue_size = None
-
-        self._bools |= JF.ALLOW_EVENT_QUEUE_OVERFLOW * int(
-            self.DEFAULT_ALLOW_EVENT_QUEUE_OVERFLOW
+        bools = 0
+        bools |= JF.ALLOW_EVENT_QUEUE_OVERFLOW * int(
+            cls.DEFAULT_ALLOW_EVENT_QUEUE_OVERFLOW
         )  # True/False
-
-        self._bools |= JF.BLOCK_EVENTS_ON_STOP * int(
-            self.DEFAULT_BLOCK_EVENTS_ON_STOP
+        bools |= JF.BLOCK_EVENTS_ON_STOP * int(
+            cls.DEFAULT_BLOCK_EVENTS_ON_STOP
         )  # True/False
-
-        self._bools |= JF.START_ON_EVENT_DISPATCH * int(
-            self.DEFAULT_START_ON_EVENT_DISPATCH
+        bools |= JF.START_ON_EVENT_DISPATCH * int(
+            cls.DEFAULT_START_ON_EVENT_DISPATCH
         )  # True/False
-        self._bools |= JF.BLOCK_EVENTS_WHILE_STOPPED * int(
-            self.DEFAULT_BLOCK_EVENTS_WHILE_STOPPED
+        bools |= JF.BLOCK_EVENTS_WHILE_STOPPED * int(
+            cls.DEFAULT_BLOCK_EVENTS_WHILE_STOPPED
         )  # True/False
-        self._bools |= JF.CLEAR_EVENTS_AT_STARTUP * int(
-            self.DEFAULT_CLEAR_EVENTS_AT_STARTUP
+        bools |= JF.CLEAR_EVENTS_AT_STARTUP * int(
+            cls.DEFAULT_CLEAR_EVENTS_AT_STARTUP
         )  # True/False
-
-        self._bools |= JF.ALLOW_DOUBLE_EVENT_DISPATCH * int(
-            self.DEFAULT_ALLOW_DOUBLE_EVENT_DISPATCH
+        bools |= JF.ALLOW_DOUBLE_EVENT_DISPATCH * int(
+            cls.DEFAULT_ALLOW_DOUBLE_EVENT_DISPATCH
         )  # True/False
-
-        self._bools |= JF.STOP_ON_EMPTY_EVENT_QUEUE * int(
-            self.DEFAULT_STOP_ON_EMPTY_EVENT_QUEUE
+        bools |= JF.STOP_ON_EMPTY_EVENT_QUEUE * int(
+            cls.DEFAULT_STOP_ON_EMPTY_EVENT_QUEUE
         )  # True/False
 
-        if self._bools & (
-            JF.BLOCK_EVENTS_WHILE_STOPPED | JF.CLEAR_EVENTS_AT_STARTUP
-        ):  # any
-            self._bools &= ~JF.START_ON_EVENT_DISPATCH  # False
+        if bools & (JF.BLOCK_EVENTS_WHILE_STOPPED | JF.CLEAR_EVENTS_AT_STARTUP):  # any
+            bools &= ~JF.START_ON_EVENT_DISPATCH  # False
 
-        self._bools |= JF.EVENT_DISPATCH_ENABLED  # True
+        cls._DEFAULT_EVENT_BOOLS = bools | JF.EVENT_DISPATCH_ENABLED  # True
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        size = self.DEFAULT_MAX_EVENT_QUEUE_SIZE
+        self._max_event_queue_size = (
+            size if isinstance(size, int) and size > 0 else None
+        )
+
+        self._bools |= self._DEFAULT_EVENT_BOOLS
 
         self._event_queue_futures: list[asyncio.Future[bool]] = []
         # used for idlling while no events are available
         self._event_queue = deque(maxlen=self._max_event_queue_size)
+        self._dropped_event_count = 0
 
         self._bools &= ~JF.STOPPING_BY_EMPTY_EVENT_QUEUE  # False
 
@@ -129,32 +163,37 @@ class BaseEventJobMixin(JobMixin):
         return DequeProxy(self._event_queue)
 
     def _add_event(self, event: _events.BaseEvent):
-        is_running = self.is_running() and not self._bools & JF.STOPPED
-        if (
-            not self._bools & JF.EVENT_DISPATCH_ENABLED
-            or (
-                self._bools & (TRUE := JF.BLOCK_EVENTS_ON_STOP | JF.IS_STOPPING) == TRUE
-            )  # all
-            or (self._bools & JF.BLOCK_EVENTS_WHILE_STOPPED and not is_running)
+        bools = self._bools
+        if not bools & JF.EVENT_DISPATCH_ENABLED or (
+            bools & _BLOCK_ON_STOP_MASK == _BLOCK_ON_STOP_MASK  # all
         ):
             return
 
-        elif (
-            len(self._event_queue) == self._max_event_queue_size
-            and not self._bools & JF.ALLOW_EVENT_QUEUE_OVERFLOW
-        ):
-            return
+        is_running = None  # only computed if needed
+        if bools & JF.BLOCK_EVENTS_WHILE_STOPPED:
+            # stopped or done jobs can't be running, skip the loop task lookup
+            is_running = not bools & _STOPPED_OR_DONE_MASK and self.is_running()
+            if not is_running:
+                return
+
+        if len(self._event_queue) == self._max_event_queue_size:
+            self._dropped_event_count += 1
+            if not bools & JF.ALLOW_EVENT_QUEUE_OVERFLOW:
+                return  # drop the new event
+
+            # otherwise, appending drops the oldest event
 
         self._event_queue.append(event)
 
-        if not is_running and self._bools & JF.START_ON_EVENT_DISPATCH:
+        if is_running is None and bools & JF.START_ON_EVENT_DISPATCH:
+            is_running = not bools & _STOPPED_OR_DONE_MASK and self.is_running()
+
+        if bools & JF.START_ON_EVENT_DISPATCH and not is_running:
             self._start()
 
-        elif self._event_queue_futures:
-            for fut in self._event_queue_futures:
-                if not fut.done():
-                    fut.set_result(True)
-            self._event_queue_futures.clear()
+        elif futs := self._event_queue_futures:
+            self._event_queue_futures = []
+            jobs._set_futures_result(futs, True)
 
     def event_check(self, event: _events.BaseEvent) -> bool:
         """A method for subclasses that can be overloaded to perform validations on a `BaseEvent`
@@ -170,37 +209,52 @@ class BaseEventJobMixin(JobMixin):
 
     async def next_event(self) -> _events.BaseEvent:
         if not self._event_queue:
-            fut = self._manager._loop.create_future()
-            self._event_queue_futures.append(fut)
+            fut = self._create_future()
+            jobs._add_waiter(self._event_queue_futures, fut)
             await fut  # wait till an event is dispatched
 
         return self._event_queue.popleft()
 
     async def wait_for_event_dispatch(self) -> bool:
         if not self._event_queue:
-            fut = self._manager._loop.create_future()
-            self._event_queue_futures.append(fut)
+            fut = self._create_future()
+            jobs._add_waiter(self._event_queue_futures, fut)
             return await fut  # wait till an event is dispatched
 
         return True
 
+    def wait_for_event_dispatch_nowait(self) -> bool:
+        """A synchronous counterpart of `wait_for_event_dispatch()`, which
+        checks for dispatched events without creating a coroutine.
+
+        Returns
+        -------
+        bool
+            Whether the event queue of this event job currently holds at least
+            one event. If `False`, `wait_for_event_dispatch()` should be
+            awaited instead.
+        """
+        return bool(self._event_queue)
+
     async def mixin_routine(self) -> None:
         if not self._event_queue and self._bools & JF.STOP_ON_EMPTY_EVENT_QUEUE:
             self._bools |= JF.STOPPING_BY_EMPTY_EVENT_QUEUE  # True
             self.stop()
             return
 
-    @contextmanager
-    def blocked_event_queue(self):
+    def blocked_event_queue(self) -> "_BlockedEventQueue":
         """A method to be used as a context manager for
         temporarily blocking the event queue of this event job
         while running an operation, thereby disabling event dispatch to it.
         """
-        try:
-            self._bools &= ~JF.EVENT_DISPATCH_ENABLED  # False
-            yield
-        finally:
-            self._bools |= JF.EVENT_DISPATCH_ENABLED  # True
+        return _BlockedEventQueue(self)
+
+    def dropped_event_count(self) -> int:
+        """`int`: The amount of events that were dropped because the event queue
+        of this event job was full. Depending on `DEFAULT_ALLOW_EVENT_QUEUE_OVERFLOW`,
+        either the newly dispatched event or the oldest queued event is dropped.
+        """
+        return self._dropped_event_count
 
     def event_queue_is_blocked(self) -> bool:
         """`bool`: Whether event dispatching to this event job's event queue
@@ -323,7 +377,7 @@ class EventJobMixin(BaseEventJobMixin):
             self._oe_max_event_handlings = None
 
         self._bools |= JF.OE_HANDLE_ONLY_INITIAL_EVENTS * int(
-            not not (self.DEFAULT_OE_HANDLE_ONLY_INITIAL_EVENTS)
+            bool(self.DEFAULT_OE_HANDLE_ONLY_INITIAL_EVENTS)
         )  # True/False
 
         self._bools |= JF.AWAIT_EVENT_DISPATCH * int(
@@ -340,16 +394,14 @@ class EventJobMixin(BaseEventJobMixin):
             self._event_dispatch_timeout_secs = None
 
         self._bools |= JF.STOP_ON_EVENT_DISPATCH_TIMEOUT * int(
-            not not (self.DEFAULT_STOP_ON_EVENT_DISPATCH_TIMEOUT)
+            bool(self.DEFAULT_STOP_ON_EVENT_DISPATCH_TIMEOUT)
         )  # True/False
 
         self._event_queue_futures: list[asyncio.Future[bool]] = []
         # used for idlling while no events are available
         self._event_queue = deque(maxlen=self._max_event_queue_size)
 
-        self._bools &= ~(
-            JF.STOPPING_BY_EMPTY_EVENT_QUEUE | JF.STOPPING_BY_EVENT_DISPATCH_TIMEOUT
-        )  # False
+        self._bools &= ~_EVENT_STOPPING_REASON_MASK  # False
 
     async def on_event(self, event: _events.BaseEvent):
         """DO NOT CALL THIS METHOD MANUALLY, EXCEPT WHEN USING `super()` WITHIN
@@ -374,7 +426,7 @@ class EventJobMixin(BaseEventJobMixin):
         else:
             try:
                 self._bools |= JF.IS_IDLING  # True
-                self._idling_since_ts = time.time()
+                self._idling_since_ts = _time()
                 event = await asyncio.wait_for(
                     self.next_event(), timeout=self._event_dispatch_timeout_secs
                 )
@@ -456,14 +508,13 @@ class EventJobMixin(BaseEventJobMixin):
     ) -> None:
         super()._stop_cleanup(reason=reason)
 
-        self._bools &= ~(
-            JF.STOPPING_BY_EVENT_DISPATCH_TIMEOUT | JF.STOPPING_BY_EMPTY_EVENT_QUEUE
-        )  # False
+        self._bools &= ~_EVENT_STOPPING_REASON_MASK  # False
 
     def get_stopping_reason(
         self,
     ) -> JobStopReasons.Internal | JobStopReasons.External | None:
-        if not self._bools & JF.IS_STOPPING:
+        bools = self._bools
+        if not bools & JF.IS_STOPPING:
             return
         elif (
             self._on_start_exception
@@ -471,30 +522,16 @@ class EventJobMixin(BaseEventJobMixin):
             or self._on_stop_exception
         ):
             return JobStopReasons.Internal.ERROR
-        elif self._bools & JF.STOPPING_BY_EMPTY_EVENT_QUEUE:
+        elif bools & JF.STOPPING_BY_EMPTY_EVENT_QUEUE:
             return JobStopReasons.Internal.EMPTY_EVENT_QUEUE
 
-        elif self._bools & JF.STOPPING_BY_EVENT_DISPATCH_TIMEOUT:
+        elif bools & JF.STOPPING_BY_EVENT_DISPATCH_TIMEOUT:
             return JobStopReasons.Internal.EVENT_DISPATCH_TIMEOUT
 
         elif self._job_loop.current_loop == self._count:
             return JobStopReasons.Internal.EXECUTION_COUNT_LIMIT
-        elif self._bools & JF.TOLD_TO_STOP_BY_SELF:
-            if self._bools & JF.TOLD_TO_RESTART:
-                return JobStopReasons.Internal.RESTART
-            elif self._bools & JF.TOLD_TO_COMPLETE:
-                return JobStopReasons.Internal.COMPLETION
-            elif self._bools & JF.TOLD_TO_BE_KILLED:
-                return JobStopReasons.Internal.KILLING
-            else:
-                return JobStopReasons.Internal.UNSPECIFIC
-        else:
-            if self._bools & JF.TOLD_TO_RESTART:
-                return JobStopReasons.External.RESTART
-            elif self._bools & JF.TOLD_TO_BE_KILLED:
-                return JobStopReasons.External.KILLING
-            else:
-                return JobStopReasons.External.UNKNOWN
+
+        return _STOPPING_REASON_TABLE[bools & _STOPPING_REASON_MASK]
 
 
 class EventSession:
@@ -577,23 +614,10 @@ class MultiEventJobMixin(EventJobMixin):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
 
-        max_event_queue_size = self.DEFAULT_MAX_EVENT_QUEUE_SIZE
-
-        if isinstance(max_event_queue_size, (int, float)):
-            self._max_event_queue_size = int(max_event_queue_size)
-            if self._max_event_queue_size <= 0:
-                self._max_event_queue_size = None
-        else:
-            self._max_event_queue_size = None
-
-        max_event_session_queue_size = self.DEFAULT_MAX_EVENT_SESSION_QUEUE_SIZE
-
-        if isinstance(max_event_session_queue_size, (int, float)):
-            self._max_event_session_queue_size = int(max_event_session_queue_size)
-            if self._max_event_session_queue_size <= 0:
-                self._max_event_session_queue_size = None
-        else:
-            self._max_event_session_queue_size = None
+        size = self.DEFAULT_MAX_EVENT_SESSION_QUEUE_SIZE
+        self._max_event_session_queue_size = (
+            size if isinstance(size, int) and size > 0 else None
+        )
 
         self._active_event_sessions: dict[_events.BaseEvent, EventSession] = {}
         self._oe_max_concurrency = max(int(self.DEFAULT_OE_MAX_CONCURRENCY), 1)
@@ -602,8 +626,8 @@ class MultiEventJobMixin(EventJobMixin):
             maxlen=self._max_event_session_queue_size
         )
 
-        self._oe_concurrency_space_futures: list[asyncio.Future] = []
-        # used for idlling while no events are available
+        self._oe_concurrency_space_future: asyncio.Future[bool] | None = None
+        # used for idling while the maximum on_event() concurrency is reached
 
         self._oe_data: ContextVar[jobs.JobNamespace] = ContextVar("oe_data")
 
@@ -654,23 +678,24 @@ class MultiEventJobMixin(EventJobMixin):
             del self._active_event_sessions[event]
             self._event_session_queue.append(event_session)
 
+            fut = self._oe_concurrency_space_future
             if (
-                self._oe_concurrency_space_futures
+                fut is not None
                 and len(self._active_event_sessions) < self._oe_max_concurrency
             ):
-                for fut in self._oe_concurrency_space_futures:
-                    if not fut.done():
-                        fut.set_result(True)
-
-                self._oe_concurrency_space_futures.clear()
+                if not fut.done():
+                    fut.set_result(True)
+                self._oe_concurrency_space_future = None
 
         oe_task.add_done_callback(_finish_event_session)
 
         return True
 
-    def _wait_for_on_event_concurrency_space(self) -> asyncio.Future[Any]:
-        fut = self._manager._loop.create_future()
-        self._oe_concurrency_space_futures.append(fut)
+    def _wait_for_on_event_concurrency_space(self) -> asyncio.Future[bool]:
+        # reuse the pending future instead of allocating one per wait
+        fut = self._oe_concurrency_space_future
+        if fut is None or fut.done():
+            fut = self._oe_concurrency_space_future = self._create_future()
         return fut
 
     async def mixin_routine(self) -> None:
@@ -725,7 +750,6 @@ class MultiEventJobMixin(EventJobMixin):
 
         if self._bools & JF.AWAIT_EVENT_DISPATCH:
             for _ in range(max_event_handlings):
-                event = self._event_queue.popleft()
                 if (event := await self._await_next_event_with_timeout()) is None:
                     return
 
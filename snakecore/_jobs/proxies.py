@@ -340,7 +340,7 @@ class JobOutputQueueProxy:
         self.__job_class = job.__class__
         self.__job_proxy = job._proxy
         self.__output_queue_names = job.OutputQueues
-        job_output_queues = self.__j._output_queues
+        job_output_queues = self.__j._output_queues or {}
         self._output_queue_proxy_dict: dict[str, _JobOutputQueueProxyDict] = {
             queue_name: {"index": 0, "rescue_buffer": None, "job_output_queue": job_output_queues[queue_name]}  # type: ignore
             for queue_name in self.__j.OutputQueues.get_all_names()  # type: ignore
@@ -855,6 +855,7 @@ class JobManagerProxy:
         if not self.__j.alive():
             self.__mgr._remove_job(self.__j)  # type: ignore
             self.__j._manager = None
+            self.__j._create_future = None
             self.__j = None  # type: ignore
             self.__mgr = None  # type: ignore
 
@@ -81,7 +81,7 @@ class MessageSend(
             mention_author=mention_author,
         )
 
-        self.data.kill_if_failed = not not kill_if_failed
+        self.data.kill_if_failed = bool(kill_if_failed)
 
     async def on_init(self):
         if not isinstance(self.data.channel, discord.abc.Messageable):
@@ -225,7 +225,7 @@ class _MessageModify(_jobs.ManagedJobBase):
         super().__init__()
         self.data.channel = channel
         self.data.message = message
-        self.data.kill_if_failed = not not kill_if_failed
+        self.data.kill_if_failed = bool(kill_if_failed)
 
     async def on_init(self) -> None:
         if not isinstance(self.data.channel, messageable_channels):
@@ -263,8 +263,8 @@ class JobBoolFlags:
 
     ...
     - `bool1 = bool2 = ... = False`:
-        - `flags &= flags ^ (flag1 | flag2 | ...)`
-        - `flags = flags & (flags ^ (flag1 | flag2 | ...))`
+        - `flags &= ~(flag1 | flag2 | ...)`
+        - `flags = flags & ~(flag1 | flag2 | ...)`
 
     ...
     - `bool1 = not bool1; bool2 = not bool2; ...`:
@@ -285,7 +285,7 @@ class JobBoolFlags:
 
     ...
     - `[not] all(bool1, bool2, ...)`:
-        - `[not] (flags & (TRUE := flag1 | flag2 | ...) == TRUE)`
+        - `[not] (flags & MASK == MASK)`, with `MASK = flag1 | flag2 | ...` precomputed
         - `[not] bool(flags & flag1 and flags & flag2 ...)`
         - `[not] (flags & (flag1 | flag2 | ...) == (flag1 | flag2 | ...))`
 
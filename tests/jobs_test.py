@@ -0,0 +1,433 @@
+import asyncio
+import datetime
+import functools
+
+import pytest
+
+from snakecore import _events
+from snakecore._jobs import ManagedJobBase, mixins, publicjobmethod
+from snakecore.exceptions import JobOutputError
+
+
+class _StubManager:
+    """A minimal stand-in for a job manager, enough to run a job's loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+
+    def get_job_stop_timeout(self):
+        return None
+
+    def _eject(self):
+        pass
+
+    def _self_ungard(self):
+        pass
+
+
+async def _start_job(job):
+    loop = asyncio.get_running_loop()
+    job._manager = _StubManager(loop)
+    job._create_future = loop.create_future
+    await job._initialize_external()
+    job._start_external()
+    await asyncio.sleep(0.02)  # let the job loop begin its first iteration
+    return job
+
+
+async def _kill_job(job):
+    done = job.await_done(timeout=2)
+    job._kill_external()
+    await done
+
+
+class Producer(ManagedJobBase):
+    DEFAULT_INTERVAL = datetime.timedelta(seconds=0.01)
+
+    class OutputFields:
+        result: str
+        other: str
+
+    class OutputQueues:
+        items: str
+
+    async def on_run(self):
+        pass
+
+
+class DisablingProducer(Producer):
+    class OutputFields(Producer.OutputFields):
+        other = "DISABLED"
+
+    class OutputQueues(Producer.OutputQueues):
+        extra: str
+
+
+@pytest.mark.asyncio
+async def test_output_field_set_get():
+    job = await _start_job(Producer())
+
+    assert not job.output_field_is_set("result")
+    with pytest.raises(JobOutputError):
+        job.get_output_field("result")
+
+    assert job.get_output_field("result", None) is None
+
+    job.set_output_field("result", "value")
+    assert job.output_field_is_set("result")
+    assert job.get_output_field("result") == "value"
+
+    with pytest.raises(JobOutputError):
+        # output fields can only be set once
+        job.set_output_field("result", "other value")
+
+    await _kill_job(job)
+
+
+@pytest.mark.asyncio
+async def test_output_field_await():
+    job = await _start_job(Producer())
+
+    waiter = asyncio.ensure_future(job.await_output_field("result", timeout=2))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    job.set_output_field("result", "value")
+    assert await waiter == "value"
+
+    with pytest.raises(asyncio.TimeoutError):
+        await job.await_output_field("other", timeout=0.01)
+
+    await _kill_job(job)
+
+
+def _wrapped_publicjobmethod(func):
+    return publicjobmethod(func)
+
+
+def _logged(func):
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        self.data.calls.append(func.__name__)
+        return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+@publicjobmethod
+def _shared(self):
+    return "shared"
+
+
+def test_public_method_discovery():
+    class PublicMethodJob(ManagedJobBase):
+        @publicjobmethod
+        def plain(self):
+            return "plain"
+
+        @_wrapped_publicjobmethod
+        def wrapped(self):
+            return "wrapped"
+
+        shared = _shared
+
+        @_logged
+        @publicjobmethod
+        def stacked(self):
+            return "stacked"
+
+        @publicjobmethod
+        async def coro(self):
+            return "coro"
+
+        def private(self):
+            return "private"
+
+    assert set(PublicMethodJob.get_public_method_names()) == {
+        "plain",
+        "wrapped",
+        "shared",
+        "stacked",
+        "coro",
+    }
+
+    job = PublicMethodJob()
+    assert job.run_public_method("plain") == "plain"
+    assert job.run_public_method("wrapped") == "wrapped"
+    assert job.run_public_method("shared") == "shared"
+
+    job.data.calls = []
+    assert job.run_public_method("stacked") == "stacked"
+    assert job.data.calls == ["stacked"]
+    assert not job.verify_public_method_suppport("private")
+
+
+@pytest.mark.asyncio
+async def test_multi_event_job_dispatches_all_queued_events():
+    class MultiEventJob(mixins.MultiEventJobMixin, ManagedJobBase):
+        DEFAULT_INTERVAL = datetime.timedelta(seconds=0.01)
+        DEFAULT_OE_MAX_EVENT_HANDLINGS = 10
+        DEFAULT_AWAIT_EVENT_DISPATCH = True
+        DEFAULT_EVENT_DISPATCH_TIMEOUT = 0.1
+
+        async def on_init(self):
+            self.data.dispatched = []
+
+        async def on_event(self, event):
+            self.data.dispatched.append(event)
+
+        async def on_run(self):
+            await self.mixin_routine()
+
+    job = await _start_job(MultiEventJob())
+
+    events = [_events.BaseEvent() for _ in range(6)]
+    for event in events:
+        job._add_event(event)
+
+    await asyncio.sleep(0.1)
+    assert job.data.dispatched == events
+
+    await _kill_job(job)
+
+
+def test_output_name_verification():
+    assert Producer.verify_output_field_support("result")
+    assert Producer.verify_output_field_support("other")
+    assert Producer.verify_output_queue_support("items")
+
+    # inherited names stay supported, disabled ones don't
+    assert DisablingProducer.verify_output_field_support("result")
+    assert not DisablingProducer.verify_output_field_support("other")
+    assert DisablingProducer.verify_output_queue_support("items")
+    assert DisablingProducer.verify_output_queue_support("extra")
+    assert not Producer.verify_output_queue_support("extra")
+
+    with pytest.raises(ValueError):
+        DisablingProducer.verify_output_field_support("other", raise_exceptions=True)
+
+    with pytest.raises(LookupError):
+        Producer.verify_output_field_support("missing", raise_exceptions=True)
+
+    with pytest.raises(LookupError):
+        Producer.verify_output_queue_support("extra", raise_exceptions=True)
+
+    with pytest.raises(ValueError):
+
+        class InvalidProducer(Producer):
+            class OutputFields(Producer.OutputFields):
+                missing = "DISABLED"
+
+
+def test_output_name_getters():
+    # names are listed in sorted order, not in the order they're declared in
+    assert Producer.get_output_field_names() == ("other", "result")
+    assert Producer.get_output_queue_names() == ("items",)
+
+    assert DisablingProducer.get_output_field_names() == ("result",)
+    assert DisablingProducer.get_output_queue_names() == ("extra", "items")
+
+    assert Producer.has_output_field_name("other")
+    assert not DisablingProducer.has_output_field_name("other")
+    assert DisablingProducer.has_output_queue_name("extra")
+    assert not Producer.has_output_queue_name("extra")
+
+    with pytest.raises(TypeError):
+        Producer.has_output_field_name(1)
+
+
+@pytest.mark.asyncio
+async def test_output_queue_rescue_buffer():
+    job = await _start_job(Producer())
+
+    proxy = job.get_output_queue_proxy()
+    proxy.config_output_queue("items", use_rescue_buffer=True)
+
+    for value in (1, 2, 3):
+        job.push_output_queue("items", value)
+
+    assert proxy.pop_output_queue("items") == 1
+    job.push_output_queue("items", 4)
+    job.clear_output_queue("items")
+
+    # the whole queue is rescued, including values already popped
+    assert proxy.pop_output_queue("items", all_values=True) == [1, 2, 3, 4]
+
+    with pytest.raises(LookupError):
+        proxy.pop_output_queue("items")
+
+    await _kill_job(job)
+
+
+class BoundedEventJob(mixins.EventJobMixin, ManagedJobBase):
+    DEFAULT_INTERVAL = datetime.timedelta(seconds=0.01)
+    DEFAULT_MAX_EVENT_QUEUE_SIZE = 2
+
+    async def on_run(self):
+        pass  # leave dispatched events in the queue
+
+
+class OverflowingEventJob(mixins.EventJobMixin, ManagedJobBase):
+    DEFAULT_INTERVAL = datetime.timedelta(seconds=0.01)
+    DEFAULT_MAX_EVENT_QUEUE_SIZE = 2
+    DEFAULT_ALLOW_EVENT_QUEUE_OVERFLOW = True
+
+    async def on_run(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_dropped_event_count():
+    events = [_events.BaseEvent() for _ in range(5)]
+
+    job = await _start_job(OverflowingEventJob())
+    assert job.dropped_event_count() == 0
+
+    for event in events:
+        job._add_event(event)
+
+    # the oldest events make room for new ones
+    assert job.dropped_event_count() == 3
+    assert list(job.event_queue) == events[-2:]
+
+    await _kill_job(job)
+
+    job = await _start_job(BoundedEventJob())
+
+    for event in events:
+        job._add_event(event)
+
+    # new events are dropped when the queue is full
+    assert job.dropped_event_count() == 3
+    assert list(job.event_queue) == events[:2]
+
+    await _kill_job(job)
+
+
+def test_public_method_is_async():
+    class AsyncMethodJob(ManagedJobBase):
+        @publicjobmethod
+        def sync_method(self):
+            return 1
+
+        @publicjobmethod
+        async def async_method(self):
+            return 2
+
+        @publicjobmethod(is_async=True)
+        def awaitable_method(self):
+            # returns an awaitable without being a coroutine function
+            return asyncio.sleep(0, 3)
+
+        @publicjobmethod(is_async=False)
+        async def forced_sync_method(self):
+            return 4
+
+    # inferred from the decorated function
+    assert not AsyncMethodJob.public_method_is_async("sync_method")
+    assert AsyncMethodJob.public_method_is_async("async_method")
+
+    # explicitly overridden
+    assert AsyncMethodJob.public_method_is_async("awaitable_method")
+    assert not AsyncMethodJob.public_method_is_async("forced_sync_method")
+
+    with pytest.raises(LookupError):
+        AsyncMethodJob.public_method_is_async("missing")
+
+
+def test_public_method_overridden_by_non_function():
+    class BaseMethodJob(ManagedJobBase):
+        @publicjobmethod
+        def as_none(self):
+            return 1
+
+        @publicjobmethod
+        def as_property(self):
+            return 2
+
+        @publicjobmethod
+        def as_staticmethod(self):
+            return 3
+
+        @publicjobmethod
+        def as_function(self):
+            return 4
+
+    class OverridingMethodJob(BaseMethodJob):
+        as_none = None
+
+        @property
+        def as_property(self):
+            return 20
+
+        @staticmethod
+        def as_staticmethod():
+            return 30
+
+        def as_function(self):
+            return 40
+
+    assert OverridingMethodJob.get_public_method_names() == ("as_function",)
+
+    job = OverridingMethodJob()
+    assert job.run_public_method("as_function") == 40
+
+    for name in ("as_none", "as_property", "as_staticmethod"):
+        assert not job.verify_public_method_suppport(name)
+        with pytest.raises(LookupError):
+            job.run_public_method(name)
+
+    assert BaseMethodJob().run_public_method("as_property") == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_event_waiter_leaves_others_pending():
+    job = await _start_job(BoundedEventJob())
+
+    cancelled = asyncio.ensure_future(job.wait_for_event_dispatch())
+    pending = asyncio.ensure_future(job.wait_for_event_dispatch())
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    assert cancelled.cancelled()
+    assert not pending.done()
+
+    job._add_event(_events.BaseEvent())
+    assert await asyncio.wait_for(pending, timeout=1) is True
+
+    await _kill_job(job)
+
+
+class TimingOutEventJob(mixins.EventJobMixin, ManagedJobBase):
+    DEFAULT_INTERVAL = datetime.timedelta(seconds=0.01)
+    DEFAULT_EVENT_DISPATCH_TIMEOUT = 0.01
+
+    async def on_run(self):
+        pass
+
+
+class TimingOutMultiEventJob(mixins.MultiEventJobMixin, ManagedJobBase):
+    DEFAULT_INTERVAL = datetime.timedelta(seconds=0.01)
+    DEFAULT_EVENT_DISPATCH_TIMEOUT = 0.01
+
+    async def on_run(self):
+        pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("job_cls", [TimingOutEventJob, TimingOutMultiEventJob])
+async def test_timed_out_event_waiter_leaves_others_pending(job_cls):
+    job = await _start_job(job_cls())
+
+    pending = asyncio.ensure_future(job.wait_for_event_dispatch())
+    await asyncio.sleep(0)
+
+    # times out and gets cancelled while the other waiter is still pending
+    assert await job._await_next_event_with_timeout() is None
+    assert not pending.done()
+
+    job._add_event(_events.BaseEvent())
+    assert await asyncio.wait_for(pending, timeout=1) is True
+
+    await _kill_job(job)